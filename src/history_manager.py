@@ -7,7 +7,7 @@ Supports append-only writes, rotation, and export.
 import csv
 import json
 import logging
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -20,7 +20,7 @@ HISTORY_DIR = Path.home() / '.config' / 'vociferous'
 HISTORY_FILE = HISTORY_DIR / 'history.jsonl'
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class HistoryEntry:
     """Single transcription history entry with timestamp, text, and duration."""
     timestamp: str
@@ -35,7 +35,11 @@ class HistoryEntry:
 
     def to_json(self) -> str:
         """Serialize to JSON line."""
-        return json.dumps(asdict(self), ensure_ascii=False)
+        # Flat fields: build the dict directly instead of asdict()'s recursive deepcopy
+        return json.dumps(
+            {'timestamp': self.timestamp, 'text': self.text, 'duration_ms': self.duration_ms},
+            ensure_ascii=False,
+        )
 
     def to_display_string(self, max_length: int = 80) -> str:
         """Format for display in list widget: [HH:MM:SS] text preview..."""
@@ -64,6 +68,16 @@ class HistoryManager:
         if not self.history_file.exists():
             self.history_file.touch()
 
+        # Bumped on every in-process write; with the file stamp it keys the recent cache
+        self._version = 0
+        self._recent_cache: (
+            tuple[tuple[int, tuple[int, int], int], list[HistoryEntry]] | None
+        ) = None
+
+        # Line count for rotation checks, valid while the file stamp matches
+        self._line_count: int | None = None
+        self._line_count_stamp: tuple[int, int] = (-1, -1)
+
     def add_entry(self, text: str, duration_ms: int = 0) -> HistoryEntry:
         """Add new transcription to history. Returns the created entry."""
         entry = HistoryEntry(
@@ -72,11 +86,18 @@ class HistoryManager:
             duration_ms=duration_ms
         )
 
+        counted = self._line_count is not None and self._line_count_stamp == self._file_stamp()
         try:
             with open(self.history_file, 'a', encoding='utf-8') as f:
                 f.write(entry.to_json() + '\n')
         except OSError as e:
             logger.error(f"Failed to write history entry: {e}")
+        else:
+            # Extend the cached count instead of recounting the whole file
+            if counted:
+                self._line_count += 1
+                self._line_count_stamp = self._file_stamp()
+        self._version += 1
 
         # Check if rotation needed
         max_entries = ConfigManager.get_config_value(
@@ -88,7 +109,26 @@ class HistoryManager:
         return entry
 
     def get_recent(self, limit: int = 100) -> list[HistoryEntry]:
-        """Get most recent entries (newest first)."""
+        """Get most recent entries (newest first); reparses only after the file changed."""
+        key = (self._version, self._file_stamp(), limit)
+        if self._recent_cache is not None and self._recent_cache[0] == key:
+            return list(self._recent_cache[1])
+
+        entries = self._read_recent(limit)
+        self._recent_cache = (key, entries)
+        return list(entries)
+
+    def _file_stamp(self) -> tuple[int, int]:
+        """Return the history file's (mtime, size), catching writes from other processes."""
+        # Size covers appends landing within the filesystem's mtime granularity
+        try:
+            st = self.history_file.stat()
+        except OSError:
+            return (-1, -1)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_recent(self, limit: int) -> list[HistoryEntry]:
+        """Parse the newest `limit` entries from disk (newest first)."""
         entries = []
 
         try:
@@ -149,6 +189,8 @@ class HistoryManager:
             with open(self.history_file, 'w', encoding='utf-8') as f:
                 for entry in entries:
                     f.write(entry.to_json() + '\n')
+            self._version += 1
+            self._line_count = None
 
             logger.info(f"Updated history entry: {timestamp}")
             return True
@@ -183,6 +225,8 @@ class HistoryManager:
             with open(self.history_file, 'w', encoding='utf-8') as f:
                 for entry in entries:
                     f.write(entry.to_json() + '\n')
+            self._version += 1
+            self._line_count = None
 
             logger.info(f"Deleted history entry: {timestamp}")
             return True
@@ -196,6 +240,8 @@ class HistoryManager:
         try:
             self.history_file.unlink(missing_ok=True)
             self.history_file.touch()
+            self._version += 1
+            self._line_count = None
             logger.info("History cleared")
         except OSError as e:
             logger.error(f"Failed to clear history: {e}")
@@ -239,12 +285,9 @@ class HistoryManager:
                                 year = dt.year
                                 f.write(f"## {month} {day}{suffix}, {year}\n\n")
                             
-                            # Time header: "10:03 p.m."
-                            time_str = dt.strftime("%I:%M %p")
-                            time_str = time_str.replace("AM", "a.m.").replace("PM", "p.m.")
-                            if time_str.startswith("0"):
-                                time_str = time_str[1:]
-                            f.write(f"### {time_str}\n\n")
+                            # Time header: "10:03 p.m." (built directly, no strftime + replace)
+                            suffix = "a.m." if dt.hour < 12 else "p.m."
+                            f.write(f"### {dt.hour % 12 or 12}:{dt.minute:02d} {suffix}\n\n")
                             
                             # Content
                             f.write(f"{entry.text}\n\n")
@@ -266,9 +309,22 @@ class HistoryManager:
             logger.error(f"Export failed: {e}")
             return False
 
+    def _count_lines(self) -> int:
+        """Return the history file's line count, recounting only after outside writes."""
+        stamp = self._file_stamp()
+        if self._line_count is None or self._line_count_stamp != stamp:
+            with open(self.history_file, 'rb') as f:
+                self._line_count = sum(1 for _ in f)
+            self._line_count_stamp = stamp
+        return self._line_count
+
     def _rotate_if_needed(self, max_entries: int) -> None:
         """Remove oldest entries if exceeding limit."""
         try:
+            # Common case: under the limit, so skip reading the file
+            if self._count_lines() <= max_entries:
+                return
+
             with open(self.history_file, encoding='utf-8') as f:
                 lines = f.readlines()
 
@@ -276,6 +332,8 @@ class HistoryManager:
                 # Keep only most recent entries
                 with open(self.history_file, 'w', encoding='utf-8') as f:
                     f.writelines(lines[-max_entries:])
+                self._version += 1
+                self._line_count = None
 
                 removed = len(lines) - max_entries
                 logger.info(f"Rotated history: removed {removed} old entries")
@@ -5,11 +5,15 @@ Handles copying text to clipboard and simulating Ctrl+V paste.
 Supports multiple backends: pynput (X11), dotool/ydotool (Wayland).
 """
 import logging
+import os
+import shutil
 import subprocess
 import time
 from contextlib import suppress
+from functools import cache
 
 from pynput.keyboard import Controller as PynputController
+from pynput.keyboard import Key as PynputKey
 
 from utils import ConfigManager
 
@@ -22,6 +26,27 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# ydotool Ctrl+V: KEY_LEFTCTRL (29) down, KEY_V (47) down/up, KEY_LEFTCTRL up
+_YDOTOOL_PASTE_ARGV = ("ydotool", "key", "29:1", "47:1", "47:0", "29:0")
+
+# Explicit MIME type stops wl-copy from spawning xdg-mime to sniff each payload
+_WL_COPY_ARGV = ("wl-copy", "--type", "text/plain")
+
+
+@cache
+def _has_executable(name: str) -> bool:
+    """Return whether an executable is on PATH (PATH is scanned once per name)."""
+    return shutil.which(name) is not None
+
+
+# Display server and tool availability, evaluated once at import
+_IS_WAYLAND = (
+    bool(os.environ.get('WAYLAND_DISPLAY'))
+    or os.environ.get('XDG_SESSION_TYPE', '').lower() == 'wayland'
+)
+_HAS_DOTOOL = _has_executable('dotool')
+_HAS_YDOTOOL = _has_executable('ydotool')
+
 
 class InputSimulator:
     """Simulates keyboard input to inject transcribed text into applications."""
@@ -30,20 +55,25 @@ class InputSimulator:
         self.input_method: str = ''
         self.dotool_process: subprocess.Popen | None = None
         self.keyboard: PynputController | None = None
+        self._prefer_wl_copy: bool = False
         self._configure_from_config()
 
     def _initialize_dotool(self) -> None:
         """Initialize dotool process for persistent Wayland input."""
-        try:
-            self.dotool_process = subprocess.Popen(
-                "dotool",
-                stdin=subprocess.PIPE,
-                text=True
-            )
-        except FileNotFoundError:
+        # Preflight instead of paying a failed fork/exec when dotool is absent
+        if not _HAS_DOTOOL:
             logger.warning('dotool not found, falling back to pynput')
             self.input_method = 'pynput'
             self.keyboard = PynputController()
+            return
+
+        # Line-buffered: each newline-terminated command is pushed immediately
+        self.dotool_process = subprocess.Popen(
+            "dotool",
+            stdin=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
 
     def _terminate_dotool(self) -> None:
         """Terminate dotool subprocess safely with proper cleanup to avoid zombies."""
@@ -141,12 +171,13 @@ class InputSimulator:
         match self.input_method:
             case 'pynput':
                 if self.keyboard:
-                    from pynput.keyboard import Key
-                    self.keyboard.press(Key.ctrl)
-                    self.keyboard.press('v')
+                    press = self.keyboard.press
+                    release = self.keyboard.release
+                    press(PynputKey.ctrl)
+                    press('v')
                     time.sleep(0.02)
-                    self.keyboard.release('v')
-                    self.keyboard.release(Key.ctrl)
+                    release('v')
+                    release(PynputKey.ctrl)
             case 'dotool':
                 if self.dotool_process and self.dotool_process.stdin:
                     with suppress(Exception):
@@ -154,22 +185,28 @@ class InputSimulator:
                         self.dotool_process.stdin.flush()
             case 'ydotool':
                 with suppress(subprocess.CalledProcessError):
-                    subprocess.run(["ydotool", "key", "29:1", "47:1", "47:0", "29:0"], check=True)
+                    subprocess.run(_YDOTOOL_PASTE_ARGV, check=True)
             case _:
                 logger.warning('Cannot simulate Ctrl+V with current input method')
 
     def _copy_to_clipboard(self, text: str) -> None:
-        """Copy text to clipboard using pyperclip or wl-copy."""
+        """Copy text to clipboard using wl-copy (Wayland) or pyperclip."""
         if not text:
             return
 
+        # On Wayland call wl-copy directly: one process, no MIME sniffing
+        if self._prefer_wl_copy:
+            with suppress(OSError, subprocess.CalledProcessError):
+                subprocess.run(_WL_COPY_ARGV, input=text, text=True, check=True)
+                return
+
         if HAS_PYPERCLIP:
             with suppress(Exception):
                 pyperclip.copy(text)
                 return
 
         try:
-            subprocess.run(["wl-copy"], input=text, text=True, check=True)
+            subprocess.run(_WL_COPY_ARGV, input=text, text=True, check=True)
         except Exception:
             logger.error('Clipboard copy failed. Install wl-clipboard or pyperclip.')
 
@@ -185,6 +222,8 @@ class InputSimulator:
 
     def _configure_from_config(self) -> None:
         """Auto-detect and configure the best available input method."""
+        self._prefer_wl_copy = _IS_WAYLAND and _has_executable('wl-copy')
+
         configured = ConfigManager.get_config_value('output_options', 'input_method')
 
         # Auto-detect if not explicitly set
@@ -208,19 +247,11 @@ class InputSimulator:
 
     def _auto_detect_input_method(self) -> str:
         """Detect the best input method for the current display server."""
-        import os
-        import shutil
-
-        # Check if running on Wayland
-        wayland_display = os.environ.get('WAYLAND_DISPLAY')
-        xdg_session = os.environ.get('XDG_SESSION_TYPE', '').lower()
-        is_wayland = wayland_display or xdg_session == 'wayland'
-
-        if is_wayland:
+        if _IS_WAYLAND:
             # Prefer dotool (persistent process) over ydotool
-            if shutil.which('dotool'):
+            if _HAS_DOTOOL:
                 return 'dotool'
-            if shutil.which('ydotool'):
+            if _HAS_YDOTOOL:
                 return 'ydotool'
             # Fall back to pynput (works with XWayland apps)
             logger.warning(
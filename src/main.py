@@ -1,24 +1,24 @@
 """
 Vociferous - Main orchestration module.
 
-Coordinates KeyListener → ResultThread → clipboard output via Qt signals.
-Tracks signal connections in _thread_connections for proper cleanup.
+Coordinates KeyListener → RecorderWorker → clipboard output via Qt signals.
+The recorder lives on one persistent QThread; its signals are connected once.
 """
 import logging
 import os
 import subprocess
 import sys
+from collections.abc import Callable
 from contextlib import suppress
 from pathlib import Path
 
-from PyQt5.QtCore import QObject
+from PyQt5.QtCore import QMetaObject, QObject, Qt, QThread, QTimer, pyqtSlot
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QAction, QApplication, QMenu, QStyle, QSystemTrayIcon
 
 from history_manager import HistoryManager
 from key_listener import KeyListener
-from result_thread import ResultThread
-from transcription import create_local_model
+from result_thread import ModelLoaderWorker, RecorderWorker
 from ui.main_window import MainWindow
 from ui.settings_dialog import SettingsDialog
 from utils import ConfigManager
@@ -32,8 +32,30 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# wl-copy fallback for the clipboard; a fixed MIME type skips its content sniffing
+_WL_COPY_ARGV = ("wl-copy", "--type", "text/plain")
+
+# Bundled tray/window icon files, best first
+_ICONS_DIR = Path(__file__).resolve().parent.parent / "icons"
+_TRAY_ICON_CANDIDATES = (
+    _ICONS_DIR / "512x512.png",
+    _ICONS_DIR / "192x192.png",
+    _ICONS_DIR / "favicon.ico",
+)
+
+# Model-option changes arriving within this window trigger a single reload
+_MODEL_RELOAD_DEBOUNCE_MS = 150
+
+# How long exit waits for worker threads to finish before quitting anyway
+_EXIT_GRACE_MS = 2000
+
+# Final wait for a worker thread after the event loop returns, before exiting without it
+_THREAD_JOIN_MS = 500
+
 # Prefer client-side decorations on Wayland so we can draw our own frame
 os.environ.setdefault("QT_WAYLAND_DISABLE_WINDOWDECORATION", "1")
+# Skip Qt's opaque-sibling clip subtraction on repaint; our widgets don't overlap
+os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
 
 
 class VociferousApp(QObject):
@@ -53,15 +75,19 @@ class VociferousApp(QObject):
         # Initialize config
         ConfigManager.initialize()
 
-        # Track active signal connections for cleanup
-        self._thread_connections: list[tuple] = []
         self.settings_dialog: SettingsDialog | None = None
+        self._cached_tray_icon: QIcon | None = None
+
+        # Clipboard strategy is resolved once, not re-decided on every copy
+        self._clipboard_copy: Callable[[str], None] = (
+            pyperclip.copy if HAS_PYPERCLIP else self._copy_via_wl_copy
+        )
 
         # Initialize components
         self.initialize_components()
 
     def initialize_components(self) -> None:
-        """Initialize components in dependency order: listener, model, UI, tray."""
+        """Initialize components in dependency order: listener, UI, tray, workers."""
         ConfigManager.console_print("Initializing Vociferous...")
 
         # Key listener for hotkey detection
@@ -69,12 +95,9 @@ class VociferousApp(QObject):
         self.key_listener.add_callback("on_activate", self.on_activation)
         self.key_listener.add_callback("on_deactivate", self.on_deactivation)
 
-        # Load whisper model
-        ConfigManager.console_print("Loading Whisper model (this may take a moment)...")
-        self.local_model = create_local_model()
-
-        # Result thread (for recording/transcription)
-        self.result_thread = None
+        # Whisper model is loaded in the background; recording waits for it
+        self.local_model = None
+        self._model_loading: bool = False
 
         # History manager for transcription storage
         self.history_manager = HistoryManager()
@@ -98,16 +121,45 @@ class VociferousApp(QObject):
         self.main_window.set_tray_icon(self.tray_icon)
         self.main_window.windowCloseRequested.connect(self._on_main_window_hidden)
 
+        # Recording/transcription worker on a persistent thread (signals wired once)
+        self._recorder_thread = QThread()
+        self.recorder = RecorderWorker(self.local_model)
+        self.recorder.moveToThread(self._recorder_thread)
+        # Worker signals always cross threads: queue explicitly, str payloads only
+        cross_thread = Qt.QueuedConnection | Qt.UniqueConnection
+        self.recorder.statusSignal.connect(
+            self.main_window.update_transcription_status, cross_thread
+        )
+        self.recorder.statusSignal.connect(self.update_tray_status, cross_thread)
+        self.recorder.resultSignal.connect(self.on_transcription_complete, cross_thread)
+        self._recorder_thread.start()
+
+        # Model loader on its own thread so the tray is usable immediately
+        self._model_thread = QThread()
+        self.model_loader = ModelLoaderWorker()
+        self.model_loader.moveToThread(self._model_thread)
+        self.model_loader.loaded.connect(self._on_model_loaded, cross_thread)
+        self._model_thread.start()
+        self._load_model()
+
+        # Hotkey handling reads these on every press; refreshed on config change/reload
+        self._load_hotkey_options()
+
+        # Coalesces bursts of model-option changes into one reload
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(_MODEL_RELOAD_DEBOUNCE_MS)
+        self._reload_timer.timeout.connect(self._reload_model)
+
         # React to configuration changes
-        ConfigManager.instance().configChanged.connect(self._on_config_changed)
+        config = ConfigManager.instance()
+        config.configChanged.connect(self._on_config_changed)
+        config.configReloaded.connect(self._on_config_reloaded)
 
         # Start listening for hotkey
         self.key_listener.start()
 
-        activation_key = ConfigManager.get_config_value(
-            'recording_options', 'activation_key'
-        )
-        ConfigManager.console_print(f"Ready! Press '{activation_key}' to start.")
+        ConfigManager.console_print(f"Ready! Press '{self._activation_key}' to start.")
 
     def create_tray_icon(self) -> None:
         """Create system tray icon with context menu."""
@@ -172,37 +224,79 @@ class VociferousApp(QObject):
         dialog = SettingsDialog(self.key_listener, self.main_window)
         dialog.exec_()
 
+    def _load_hotkey_options(self) -> None:
+        """Cache the recording mode and activation key read by the hotkey callbacks."""
+        self._recording_mode = ConfigManager.get_config_value(
+            'recording_options', 'recording_mode'
+        )
+        self._activation_key = ConfigManager.get_config_value(
+            'recording_options', 'activation_key'
+        )
+
+    @pyqtSlot()
+    def _on_config_reloaded(self) -> None:
+        """Re-read cached hotkey options after the whole config was reloaded from disk."""
+        previous_key = self._activation_key
+        self._load_hotkey_options()
+        if self._activation_key != previous_key:
+            self.key_listener.update_activation_keys()
+
     def _on_config_changed(self, section: str, key: str, value) -> None:
         """Handle live config updates for hotkey, backend, and model changes."""
         if section == 'recording_options' and key == 'activation_key':
+            self._activation_key = value
             self.key_listener.update_activation_keys()
             return
 
+        if section == 'recording_options' and key == 'recording_mode':
+            self._recording_mode = value
+            return
+
         if section == 'recording_options' and key == 'input_backend':
             self.key_listener.update_backend()
             return
 
         # Reload model when model options change
         if section == 'model_options' and key in {'compute_type', 'device', 'language'}:
-            self._reload_model()
+            self._reload_timer.start()  # Restarting an active timer extends the window
 
     def _reload_model(self) -> None:
         """Reload the Whisper model with updated configuration."""
+        # The current model keeps serving recordings until the new one arrives
         ConfigManager.console_print("Reloading Whisper model...")
-        self.local_model = create_local_model()
-        ConfigManager.console_print("Model reloaded successfully.")
+        self._load_model()
+
+    def _load_model(self) -> None:
+        """Queue a model load on the loader thread."""
+        self._model_loading = True
+        if self.local_model is None:
+            self.update_tray_status('loading')
+        QMetaObject.invokeMethod(self.model_loader, "load", Qt.QueuedConnection)
+
+    @pyqtSlot(object)
+    def _on_model_loaded(self, model) -> None:
+        """Install a freshly loaded model (None means loading failed)."""
+        self._model_loading = False
+        if model is None:
+            if self.local_model is None:
+                self.update_tray_status('error')
+            return
+
+        first_load = self.local_model is None
+        self.local_model = model
+        self.recorder.local_model = model
+        if first_load:
+            self.update_tray_status('idle')
+        ConfigManager.console_print("Model ready.")
 
     def _build_tray_icon(self) -> QIcon:
         """Return a non-empty icon for the tray using bundled assets with fallbacks."""
-        icons_dir = Path(__file__).resolve().parent.parent / "icons"
-        candidates = [
-            icons_dir / "512x512.png",
-            icons_dir / "192x192.png",
-            icons_dir / "favicon.ico",
-        ]
+        # Built once: shared by the window and the tray
+        if self._cached_tray_icon is not None:
+            return self._cached_tray_icon
 
         icon = QIcon()
-        for candidate in candidates:
+        for candidate in _TRAY_ICON_CANDIDATES:
             if candidate.is_file():
                 icon.addFile(str(candidate))
 
@@ -213,86 +307,56 @@ class VociferousApp(QObject):
             app_instance = QApplication.instance()
             style = self.app.style() if hasattr(self, 'app') else app_instance.style()
             icon = style.standardIcon(QStyle.SP_MediaPlay) if style else QIcon()
+
+        self._cached_tray_icon = icon
         return icon
 
     def on_activation(self):
         """Called when activation key is pressed."""
-        recording_mode = ConfigManager.get_config_value(
-            'recording_options', 'recording_mode'
-        )
+        if self.local_model is None:
+            # Nothing to transcribe with yet: say so instead of recording.
+            # This runs on the listener thread, so the tray update is queued to the GUI.
+            QMetaObject.invokeMethod(self, "_report_model_unavailable", Qt.QueuedConnection)
+            return
 
-        if self.result_thread and self.result_thread.isRunning():
+        if self.recorder.is_busy:
             # Already recording - stop it
-            if recording_mode == 'press_to_toggle':
-                self.result_thread.stop_recording()
+            if self._recording_mode == 'press_to_toggle':
+                self.recorder.stop_recording()
             return
 
         # Start new recording
         self.start_result_thread()
 
+    @pyqtSlot()
+    def _report_model_unavailable(self) -> None:
+        """Show why a hotkey press was ignored (GUI thread, where _model_loading lives)."""
+        if self.local_model is None:
+            self.update_tray_status('loading' if self._model_loading else 'error')
+
     def on_deactivation(self):
         """Called when activation key is released (for hold_to_record mode)."""
-        recording_mode = ConfigManager.get_config_value(
-            'recording_options', 'recording_mode'
-        )
-
-        if (
-            recording_mode == 'hold_to_record'
-            and self.result_thread
-            and self.result_thread.isRunning()
-        ):
-            self.result_thread.stop_recording()
+        if self._recording_mode == 'hold_to_record' and self.recorder.is_busy:
+            self.recorder.stop_recording()
 
     def start_result_thread(self):
-        """Start recording/transcription thread with tracked signal connections."""
-        if self.result_thread and self.result_thread.isRunning():
+        """Queue a recording session on the persistent recorder worker."""
+        # Claim the worker now so a second press can't queue another session
+        if not self.recorder.request_session():
             return
-
-        # Clean up any previous thread connections
-        self._disconnect_thread_signals()
-
-        self.result_thread = ResultThread(self.local_model)
-
-        # Store connections for later cleanup (allows proper disconnection)
-        status_slot = self.main_window.update_transcription_status
-        self._thread_connections = [
-            (self.result_thread.statusSignal, status_slot),
-            (self.result_thread.statusSignal, self.update_tray_status),
-            (self.result_thread.resultSignal, self.on_transcription_complete),
-        ]
-
-        # Connect all signals
-        for signal, slot in self._thread_connections:
-            signal.connect(slot)
-
-        # Auto-cleanup: when thread finishes, disconnect signals and schedule deletion
-        self.result_thread.finished.connect(self._on_thread_finished)
-        self.result_thread.start()
-
-    def _disconnect_thread_signals(self) -> None:
-        """Safely disconnect all tracked thread signal connections."""
-        for signal, slot in self._thread_connections:
-            with suppress(TypeError, RuntimeError):
-                signal.disconnect(slot)
-        self._thread_connections.clear()
-
-    def _on_thread_finished(self) -> None:
-        """Handle thread completion: cleanup signals and schedule deletion."""
-        self._disconnect_thread_signals()
-        if self.result_thread:
-            self.result_thread.deleteLater()
-            self.result_thread = None
+        QMetaObject.invokeMethod(self.recorder, "start_recording", Qt.QueuedConnection)
 
     def stop_result_thread(self) -> None:
-        """Stop the recording/transcription thread."""
-        if self.result_thread and self.result_thread.isRunning():
-            self.result_thread.stop()
+        """Stop the recording/transcription session."""
+        if self.recorder.is_busy:
+            self.recorder.stop()
 
     def _cancel_recording(self) -> None:
         """Cancel recording early without transcribing."""
-        if self.result_thread and self.result_thread.isRunning():
-            self.result_thread.stop()
+        if self.recorder.is_busy:
+            self.recorder.stop()
 
+    @pyqtSlot(str)
     def update_tray_status(self, status: str) -> None:
         """Update tray icon tooltip based on current status."""
         match status:
@@ -300,6 +364,8 @@ class VociferousApp(QObject):
                 text = 'Vociferous - Recording...'
             case 'transcribing':
                 text = 'Vociferous - Transcribing...'
+            case 'loading':
+                text = 'Vociferous - Loading model...'
             case 'error':
                 text = 'Vociferous - Error'
             case _:
@@ -307,6 +373,7 @@ class VociferousApp(QObject):
         self.status_action.setText(text)
         self.tray_icon.setToolTip(text)
 
+    @pyqtSlot(str)
     def on_transcription_complete(self, result: str) -> None:
         """Handle completed transcription: add to history and copy to clipboard."""
         if not result:
@@ -343,37 +410,91 @@ class VociferousApp(QObject):
         self.main_window.load_entry_for_edit(text, timestamp)
 
     def _copy_to_clipboard(self, text: str) -> None:
-        """Copy text to clipboard using available method."""
-        if HAS_PYPERCLIP:
-            with suppress(Exception):
-                pyperclip.copy(text)
-                logger.debug("Copied to clipboard via pyperclip")
-                return
-
-        # Fallback to wl-copy (Wayland)
+        """Copy text to clipboard using the strategy resolved at startup."""
         with suppress(Exception):
-            subprocess.run(["wl-copy"], input=text, text=True, check=True)
+            self._clipboard_copy(text)
+            logger.debug("Copied to clipboard")
+            return
+
+        if self._clipboard_copy == self._copy_via_wl_copy:
+            return
+
+        # pyperclip failed (e.g. no usable backend): switch to wl-copy for good if it works
+        with suppress(Exception):
+            self._copy_via_wl_copy(text)
+            self._clipboard_copy = self._copy_via_wl_copy
             logger.debug("Copied to clipboard via wl-copy")
 
+    def _copy_via_wl_copy(self, text: str) -> None:
+        """Copy text with wl-copy (Wayland)."""
+        subprocess.run(_WL_COPY_ARGV, input=text, text=True, check=True)
+
     def cleanup(self) -> None:
-        """Clean up resources."""
-        # Stop and clean up result thread
-        if self.result_thread and self.result_thread.isRunning():
-            self.result_thread.stop()
-            self.result_thread.wait(2000)  # Wait up to 2 seconds for graceful stop
-        self._disconnect_thread_signals()
+        """Clean up resources; worker threads wind down without blocking the UI."""
+        # Cancel any session, drop all worker connections in one call, stop the threads
+        self.recorder.stop()
+        with suppress(TypeError, RuntimeError):
+            self.recorder.disconnect()
+        with suppress(TypeError, RuntimeError):
+            self.model_loader.disconnect()
+
+        for thread, worker in (
+            (self._recorder_thread, self.recorder),
+            (self._model_thread, self.model_loader),
+        ):
+            thread.finished.connect(worker.deleteLater)
+            thread.quit()
 
         if self.key_listener:
             self.key_listener.stop()
 
     def exit_app(self) -> None:
-        """Exit the application."""
+        """Exit the application once the worker threads have finished."""
         self.cleanup()
-        QApplication.quit()
+
+        running = [
+            thread for thread in (self._recorder_thread, self._model_thread)
+            if thread.isRunning()
+        ]
+        if not running:
+            QApplication.quit()
+            return
+
+        for thread in running:
+            thread.finished.connect(self._on_worker_thread_finished)
+        # Upper bound so a long transcription or model download can't hold exit hostage
+        QTimer.singleShot(_EXIT_GRACE_MS, QApplication.quit)
+
+    @pyqtSlot()
+    def _on_worker_thread_finished(self) -> None:
+        """Quit the event loop when the last worker thread has finished."""
+        if not (self._recorder_thread.isRunning() or self._model_thread.isRunning()):
+            QApplication.quit()
+
+    def _join_worker_threads(self, exit_code: int) -> None:
+        """Stop idle worker threads; exit outright if one is still busy."""
+        busy = False
+        for thread in (self._recorder_thread, self._model_thread):
+            if not thread.isRunning():
+                continue
+            thread.quit()
+            busy |= not thread.wait(_THREAD_JOIN_MS)
+        if not busy:
+            return
+
+        # A model load or transcription can't be interrupted safely, and destroying
+        # its QThread while it runs aborts the process: leave without tearing it down
+        logger.warning("Worker thread still busy at exit; exiting without waiting for it")
+        logging.shutdown()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
 
     def run(self) -> int:
         """Run the application."""
-        return self.app.exec_()
+        exit_code = self.app.exec_()
+        self._join_worker_threads(exit_code)
+        return exit_code
 
 
 if __name__ == '__main__':
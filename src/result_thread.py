@@ -1,11 +1,16 @@
 """
-Audio recording and transcription thread for Vociferous.
+Audio recording and transcription worker for Vociferous.
 
 Captures audio from microphone, applies Voice Activity Detection (VAD),
-and sends audio to the Whisper transcription engine via QThread.
+and sends audio to the Whisper transcription engine. A single long-lived
+RecorderWorker lives on a persistent QThread; each recording is started by
+queuing its start_recording() slot instead of creating a new thread.
 """
 import logging
+import os
 import time
+from contextlib import suppress
+from dataclasses import dataclass
 from queue import Empty, Queue
 from typing import TYPE_CHECKING
 
@@ -13,9 +18,9 @@ import numpy as np
 import sounddevice as sd
 import webrtcvad
 from numpy.typing import NDArray
-from PyQt5.QtCore import QMutex, QThread, pyqtSignal
+from PyQt5.QtCore import QMutex, QObject, QThread, pyqtSignal, pyqtSlot
 
-from transcription import transcribe
+from transcription import create_local_model, transcribe
 from utils import ConfigManager
 
 if TYPE_CHECKING:
@@ -23,12 +28,102 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+FRAME_DURATION_MS = 30  # WebRTC VAD frame duration
+
+# Pre-speech energy gate: the quietest of the first skipped frames estimates the
+# noise floor; frames below floor * margin are silence without asking webrtcvad
+ENERGY_CALIBRATION_FRAMES = 3
+ENERGY_FLOOR_MARGIN = 2
+# Upper bound on the gate as mean |sample| (about -50 dBFS), so a noisy start
+# can't hide quiet speech from webrtcvad for the whole session
+ENERGY_FLOOR_CEILING = 100
+
+# SCHED_RR priority requested for the capture phase (best effort, needs rtprio rights)
+CAPTURE_RT_PRIORITY = 10
+
+
+@dataclass(slots=True)
+class _CaptureState:
+    """Per-session state of the capture loop, carried across frame batches."""
+
+    recording: NDArray[np.int16]
+    recorded: int = 0
+    frames_to_skip: int = 0
+    calibration_frames: int = ENERGY_CALIBRATION_FRAMES
+    energy_floor: int | None = None  # Sum of |samples| per frame, set during the skip
+    speech_detected: bool = False
+    silent_frame_count: int = 0
+
+
+def _consume_frames(
+    batch: list[bytes | None],
+    state: _CaptureState,
+    vad: webrtcvad.Vad | None,
+    silence_frames: int,
+    sample_rate: int,
+) -> bool:
+    """Buffer a batch of frames and run VAD; return True once trailing silence is reached."""
+    for frame_bytes in batch:
+        if frame_bytes is None:  # Stop wake-up; the capture loop condition decides
+            continue
+
+        frame: NDArray[np.int16] = np.frombuffer(frame_bytes, dtype=np.int16)  # Zero-copy view
+
+        frame_len: int = frame.shape[0]
+        recorded: int = state.recorded
+        if recorded + frame_len > state.recording.shape[0]:
+            capacity = max(state.recording.shape[0] * 2, recorded + frame_len)
+            state.recording = np.resize(state.recording, capacity)
+        state.recording[recorded:recorded + frame_len] = frame
+        state.recorded = recorded + frame_len
+
+        # Skip initial frames to avoid key press sounds
+        if state.frames_to_skip > 0:
+            state.frames_to_skip -= 1
+            if vad and state.calibration_frames > 0:
+                state.calibration_frames -= 1
+                energy = int(np.abs(frame, dtype=np.int32).sum())
+                floor = min(energy * ENERGY_FLOOR_MARGIN, ENERGY_FLOOR_CEILING * frame_len)
+                if state.energy_floor is None or floor < state.energy_floor:
+                    state.energy_floor = floor
+            continue
+
+        if not vad:
+            continue
+
+        # Before speech starts, clearly silent frames never reach webrtcvad
+        is_speech: bool
+        if (
+            not state.speech_detected
+            and state.energy_floor is not None
+            and int(np.abs(frame, dtype=np.int32).sum()) < state.energy_floor
+        ):
+            is_speech = False
+        else:
+            is_speech = vad.is_speech(frame_bytes, sample_rate)
+
+        match (is_speech, state.speech_detected):
+            case (True, False):
+                ConfigManager.console_print("Speech detected.")
+                state.speech_detected = True
+                state.silent_frame_count = 0
+            case (True, True):
+                state.silent_frame_count = 0
+            case (False, _):
+                state.silent_frame_count += 1
+
+        if state.speech_detected and state.silent_frame_count > silence_frames:
+            return True
+
+    return False
 
-class ResultThread(QThread):
+
+class RecorderWorker(QObject):
     """
-    QThread for audio recording and transcription.
+    Worker object for audio recording and transcription.
 
     Pipeline: capture audio → VAD filtering → Whisper transcription → emit result.
+    Moved to a dedicated QThread once and reused for every recording session.
     Signals cross thread boundaries safely via Qt's meta-object system.
     """
 
@@ -36,55 +131,155 @@ class ResultThread(QThread):
     resultSignal = pyqtSignal(str)
 
     def __init__(self, local_model: 'WhisperModel | None' = None) -> None:
-        """Initialize the ResultThread."""
+        """Initialize the RecorderWorker."""
         super().__init__()
         self.local_model = local_model
         self.is_recording: bool = False
         self.is_running: bool = True
-        self.sample_rate: int | None = None
+        # True from the moment a session is requested until it has finished
+        self.is_busy: bool = False
         self.mutex = QMutex()
+        # Last status emitted, so repeated states don't cross the thread boundary again
+        self._last_status: str = 'idle'
+        # Frame queue of the capture in progress; a None item wakes the loop to stop
+        self._audio_queue: Queue[bytes | None] | None = None
+
+        # Capture parameters, derived from config once and refreshed on change
+        self.sample_rate: int = 16000
+        self.frame_size: int = 0
+        self.silence_frames: int = 0
+        self.initial_frames_to_skip: int = 0
+        self.recording_mode: str = 'continuous'
+        self.min_duration_ms: int = 100
+        self._load_recording_options()
+
+        config = ConfigManager.instance()
+        config.configChanged.connect(self._on_config_changed)
+        config.configReloaded.connect(self._load_recording_options)
+
+    @pyqtSlot()
+    def _load_recording_options(self) -> None:
+        """Derive capture parameters from the recording_options config section."""
+        recording_options = ConfigManager.get_config_section('recording_options')
+        self.sample_rate = recording_options.get('sample_rate') or 16000
+        self.frame_size = int(self.sample_rate * (FRAME_DURATION_MS / 1000.0))
+        silence_duration_ms = recording_options.get('silence_duration') or 900
+        self.silence_frames = int(silence_duration_ms / FRAME_DURATION_MS)
+
+        # 150ms delay to avoid capturing key press sounds
+        self.initial_frames_to_skip = int(0.15 * self.sample_rate / self.frame_size)
+
+        self.recording_mode = recording_options.get('recording_mode') or 'continuous'
+        self.min_duration_ms = recording_options.get('min_duration') or 100
+
+    @pyqtSlot(str, str, object)
+    def _on_config_changed(self, section: str, key: str, value) -> None:
+        """Refresh cached capture parameters when recording options change."""
+        if section == 'recording_options':
+            self._load_recording_options()
+
+    def request_session(self) -> bool:
+        """
+        Arm a session from the UI thread before queueing start_recording().
+
+        Flags are set here, under the same lock as the stop paths, so a stop that
+        arrives before the queued slot runs is not overwritten by it.
+        Returns False if a session is already in progress.
+        """
+        self.mutex.lock()
+        try:
+            if self.is_busy:
+                return False
+            self.is_busy = True
+            self.is_running = True
+            self.is_recording = True
+            return True
+        finally:
+            self.mutex.unlock()
 
     def stop_recording(self) -> None:
         """Stop the current recording session."""
         self.mutex.lock()
         self.is_recording = False
         self.mutex.unlock()
+        self._wake_capture()
 
     def stop(self) -> None:
-        """Stop the entire thread execution."""
+        """Cancel the current session; any pending transcription is discarded."""
         self.mutex.lock()
         self.is_running = False
+        self.is_recording = False
         self.mutex.unlock()
-        self.statusSignal.emit('idle')
-        self.wait()
+        self._wake_capture()
+        self._set_status('idle')
+
+    def _set_status(self, status: str) -> None:
+        """Emit statusSignal only when the status actually changes."""
+        # Called from both threads: check, assign and emit under the lock so a late
+        # worker update can't land after a cancel's 'idle'. Receivers are queued.
+        self.mutex.lock()
+        try:
+            if status == self._last_status:
+                return
+            if status != 'idle' and not self.is_running:
+                return  # Cancelled: the session's remaining states are moot
+            self._last_status = status
+            self.statusSignal.emit(status)
+        finally:
+            self.mutex.unlock()
 
-    def run(self) -> None:
+    def _set_capture_priority(self, raised: bool) -> None:
+        """Raise the worker thread's priority for capture, or restore it to normal."""
+        thread = QThread.currentThread()
+        thread.setPriority(QThread.TimeCriticalPriority if raised else QThread.NormalPriority)
+
+        # Real-time scheduling for this thread only; silently skipped without privileges
+        with suppress(AttributeError, OSError):
+            if raised:
+                os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(CAPTURE_RT_PRIORITY))
+            else:
+                os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+
+    def _wake_capture(self) -> None:
+        """Unblock the capture loop so it sees a stop request immediately."""
+        audio_queue = self._audio_queue
+        if audio_queue is not None:
+            audio_queue.put(None)
+
+    @pyqtSlot()
+    def start_recording(self) -> None:
         """
-        Main thread execution: record audio, transcribe, emit result.
-        
-        Always use start() to spawn thread - never call run() directly.
+        Record audio, transcribe, emit result.
+
+        Runs on the worker thread - arm with request_session(), then invoke
+        via a queued connection, never call directly from the UI thread.
         Wrapped in try/finally to ensure cleanup on error.
         """
         try:
-            if not self.is_running:
-                return
-
+            # Stopped or cancelled while this call was still queued
             self.mutex.lock()
-            self.is_recording = True
+            stopped = not (self.is_running and self.is_recording)
             self.mutex.unlock()
+            if stopped:
+                return
 
-            self.statusSignal.emit('recording')
+            self._set_status('recording')
             ConfigManager.console_print('Recording...')
-            audio_data = self._record_audio()
+            self._set_capture_priority(True)
+            try:
+                audio_data = self._record_audio()
+            finally:
+                # Transcription is long and CPU-bound: don't let it starve the UI
+                self._set_capture_priority(False)
 
             if not self.is_running:
                 return
 
             if audio_data is None:
-                self.statusSignal.emit('idle')
+                self._set_status('idle')
                 return
 
-            self.statusSignal.emit('transcribing')
+            self._set_status('transcribing')
             ConfigManager.console_print('Transcribing...')
 
             # Time the transcription process
@@ -99,15 +294,16 @@ class ResultThread(QThread):
             if not self.is_running:
                 return
 
-            self.statusSignal.emit('idle')
+            self._set_status('idle')
             self.resultSignal.emit(result)
 
         except Exception:
             logger.exception("Error during recording/transcription")
-            self.statusSignal.emit('error')
+            self._set_status('error')
             self.resultSignal.emit('')
         finally:
             self.stop_recording()
+            self.is_busy = False
 
     def _record_audio(self) -> NDArray[np.int16] | None:
         """
@@ -117,83 +313,91 @@ class ResultThread(QThread):
         Uses WebRTC VAD to auto-stop when silence is detected.
         Returns None if recording is too short.
         """
-        recording_options = ConfigManager.get_config_section('recording_options')
-        self.sample_rate = recording_options.get('sample_rate') or 16000
-        frame_duration_ms = 30  # WebRTC VAD frame duration
-        frame_size = int(self.sample_rate * (frame_duration_ms / 1000.0))
-        silence_duration_ms = recording_options.get('silence_duration') or 900
-        silence_frames = int(silence_duration_ms / frame_duration_ms)
-
-        # 150ms delay to avoid capturing key press sounds
-        initial_frames_to_skip = int(0.15 * self.sample_rate / frame_size)
+        frame_size = self.frame_size
 
         # Create VAD for voice activity detection modes
-        recording_mode = recording_options.get('recording_mode') or 'continuous'
         vad = None
-        speech_detected = False
-        silent_frame_count = 0
-
-        if recording_mode in ('voice_activity_detection', 'continuous'):
+        if self.recording_mode in ('voice_activity_detection', 'continuous'):
             vad = webrtcvad.Vad(2)  # Aggressiveness: 0-3 (higher = more aggressive)
 
-        # Thread-safe queue for audio callback data
-        audio_queue: Queue[NDArray[np.int16]] = Queue()
-        recording: list[np.int16] = []
+        # Thread-safe queue for raw int16 frames from the audio callback
+        audio_queue: Queue[bytes | None] = Queue()
+        self._audio_queue = audio_queue
+        frame_bytes_len = frame_size * 2  # Mono int16
+
+        # Preallocated sample buffer (grown by doubling) - no per-sample objects
+        state = _CaptureState(
+            recording=np.empty(self.sample_rate * 60, dtype=np.int16),
+            frames_to_skip=self.initial_frames_to_skip,
+        )
+
+        # Partial frame carried between callbacks when blocks don't align to frame_size
+        leftover = bytearray()
 
-        def audio_callback(indata, frames, time_info, status) -> None:
+        def audio_callback(indata, frames: int, time_info, status: 'sd.CallbackFlags') -> None:
             if status:
                 logger.debug(f"Audio callback status: {status}")
-            # Copy audio data - numpy arrays share memory
-            audio_queue.put(indata[:, 0].copy())
+            # Common case: exactly one frame - copy out of PortAudio's reused buffer
+            if not leftover and len(indata) == frame_bytes_len:
+                audio_queue.put(bytes(indata))
+                return
+
+            # Re-chunk into exact VAD frames instead of dropping short reads
+            leftover.extend(indata)
+            while len(leftover) >= frame_bytes_len:
+                # Copy through a view: slicing the bytearray would copy twice
+                with memoryview(leftover) as view:
+                    audio_queue.put(bytes(view[:frame_bytes_len]))
+                del leftover[:frame_bytes_len]
 
-        with sd.InputStream(
+        with sd.RawInputStream(
             samplerate=self.sample_rate,
             channels=1,
             dtype='int16',
             blocksize=frame_size,
             callback=audio_callback
         ):
-            while self.is_running and self.is_recording:
-                try:
-                    frame = audio_queue.get(timeout=0.1)
-                except Empty:
-                    continue
-
-                if len(frame) < frame_size:
-                    continue
-
-                recording.extend(frame)
-
-                # Skip initial frames to avoid key press sounds
-                if initial_frames_to_skip > 0:
-                    initial_frames_to_skip -= 1
-                    continue
-
-                if vad:
-                    is_speech = vad.is_speech(frame.tobytes(), self.sample_rate)
-                    match (is_speech, speech_detected):
-                        case (True, False):
-                            ConfigManager.console_print("Speech detected.")
-                            speech_detected = True
-                            silent_frame_count = 0
-                        case (True, True):
-                            silent_frame_count = 0
-                        case (False, _):
-                            silent_frame_count += 1
-
-                    if speech_detected and silent_frame_count > silence_frames:
-                        break
-
-        audio_data = np.array(recording, dtype=np.int16)
+            silence_reached = False
+            while self.is_running and self.is_recording and not silence_reached:
+                # Sleeps until a frame arrives or a stop request wakes it - no polling
+                batch = [audio_queue.get()]
+
+                # Drain frames that queued up meanwhile without further blocking waits
+                with suppress(Empty):
+                    while True:
+                        batch.append(audio_queue.get_nowait())
+
+                silence_reached = _consume_frames(
+                    batch, state, vad, self.silence_frames, self.sample_rate
+                )
+
+        self._audio_queue = None
+
+        audio_data = state.recording[:state.recorded]  # View, no copy
         duration = len(audio_data) / self.sample_rate
-        min_duration_ms = recording_options.get('min_duration') or 100
 
         ConfigManager.console_print(
             f'Recording finished: {audio_data.size} samples, {duration:.2f}s'
         )
 
-        if (duration * 1000) < min_duration_ms:
+        if (duration * 1000) < self.min_duration_ms:
             ConfigManager.console_print('Discarded: too short')
             return None
 
         return audio_data
+
+
+class ModelLoaderWorker(QObject):
+    """Loads the Whisper model on its own QThread so startup and reloads don't block the UI."""
+
+    loaded = pyqtSignal(object)
+
+    @pyqtSlot()
+    def load(self) -> None:
+        """Create the model and emit it, or None if loading failed."""
+        try:
+            model = create_local_model()
+        except Exception:
+            logger.exception('Failed to load Whisper model')
+            model = None
+        self.loaded.emit(model)
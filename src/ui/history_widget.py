@@ -3,17 +3,30 @@ Transcription history display widget.
 
 Displays scrollable list of past transcriptions with day grouping.
 Single-click loads into editor, double-click copies to clipboard.
+Rows live in a HistoryModel; collapsed days are filtered out by a proxy.
 """
-import subprocess
-from contextlib import suppress
-from datetime import datetime
-
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QRect, QSize
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+
+from PyQt5.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QRect,
+    QSize,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt5.QtCore import QFileSystemWatcher
 from PyQt5.QtGui import QBrush, QColor, QFont, QPen, QKeySequence
 from PyQt5.QtWidgets import (
-    QListWidget,
-    QListWidgetItem,
+    QApplication,
+    QListView,
     QMenu,
     QShortcut,
     QStyledItemDelegate,
@@ -22,12 +35,198 @@ from PyQt5.QtWidgets import (
 
 from history_manager import HistoryEntry, HistoryManager
 
-# Optional clipboard support
-try:
-    import pyperclip
-    HAS_PYPERCLIP = True
-except ImportError:
-    HAS_PYPERCLIP = False
+
+@lru_cache(maxsize=64)
+def _format_day_header(day: date) -> str:
+    """Return a friendly day header like 'December 13th'."""
+    return f"{day.strftime('%B')} {day.day}{_ordinal_suffix(day.day)}"
+
+
+@lru_cache(maxsize=32)
+def _ordinal_suffix(n: int) -> str:
+    """Return English ordinal suffix for a day (st/nd/rd/th)."""
+    if 11 <= (n % 100) <= 13:
+        return "th"
+    match n % 10:
+        case 1:
+            return "st"
+        case 2:
+            return "nd"
+        case 3:
+            return "rd"
+        case _:
+            return "th"
+
+
+@dataclass(slots=True)
+class HistoryRow:
+    """One list row: a day header or a transcription entry."""
+    day_key: str
+    is_header: bool
+    text: str  # Header label or entry preview
+    time_str: str = ""
+    entry: HistoryEntry | None = None
+
+
+class HistoryModel(QAbstractListModel):
+    """Flat list of day headers and entries (newest first) backing HistoryWidget."""
+
+    # Custom data roles
+    ROLE_DAY_KEY = Qt.UserRole + 1  # Store day key on headers and entries
+    ROLE_IS_HEADER = Qt.UserRole + 2  # True if item is a day header
+    ROLE_TIME = Qt.UserRole + 3  # Store formatted timestamp string
+    ROLE_TIMESTAMP_ISO = Qt.UserRole + 4  # Store ISO timestamp
+    ROLE_ENTRY = Qt.UserRole + 5  # The HistoryEntry itself, passed by reference
+
+    # Header styling, built once at import and shared by every header row
+    _HEADER_FONT = QFont()
+    _HEADER_FONT.setBold(True)
+    _HEADER_FONT.setPointSize(12)
+    _HEADER_FG = QBrush(QColor("#ffffff"))  # Expanded
+    _HEADER_FG_COLLAPSED = QBrush(QColor("#888888"))
+    _HEADER_BG = QBrush(QColor("#1a1a1a"))
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: list[HistoryRow] = []
+        self.collapsed_days: set[str] = set()
+        self._entry_count = 0  # Non-header rows, kept in step with _rows
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:
+        # None stands for the root index
+        return 0 if parent is not None and parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        match role:
+            case Qt.DisplayRole:
+                return row.text
+            case Qt.UserRole:
+                return row.entry.text if row.entry else None
+            case self.ROLE_DAY_KEY:
+                return row.day_key
+            case self.ROLE_IS_HEADER:
+                return row.is_header
+            case self.ROLE_TIME:
+                return row.time_str
+            case self.ROLE_TIMESTAMP_ISO:
+                return row.entry.timestamp if row.entry else None
+            case self.ROLE_ENTRY:
+                return row.entry
+
+        if not row.is_header:
+            return None
+
+        # Distinctive header styling: bold, darker background, gray when collapsed
+        match role:
+            case Qt.FontRole:
+                return self._HEADER_FONT
+            case Qt.ForegroundRole:
+                if row.day_key in self.collapsed_days:
+                    return self._HEADER_FG_COLLAPSED
+                return self._HEADER_FG
+            case Qt.BackgroundRole:
+                return self._HEADER_BG
+            case Qt.TextAlignmentRole:
+                return int(Qt.AlignCenter)
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        """Replace a row's display text (used for transient copy feedback)."""
+        if not index.isValid() or role != Qt.DisplayRole:
+            return False
+        self._rows[index.row()].text = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if self._rows[index.row()].is_header:
+            return Qt.ItemIsEnabled  # Non-selectable header
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def row_at(self, row: int) -> HistoryRow:
+        """Return the row object at a source row number."""
+        return self._rows[row]
+
+    def reset_rows(self, rows: list[HistoryRow], collapsed_days: set[str]) -> None:
+        """Replace all rows in one model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self.collapsed_days = collapsed_days
+        self._entry_count = sum(1 for row in rows if not row.is_header)
+        self.endResetModel()
+
+    def first_header_day(self) -> str | None:
+        """Return the day key of the top row if it is a header."""
+        if self._rows and self._rows[0].is_header:
+            return self._rows[0].day_key
+        return None
+
+    def insert_entry(self, row: HistoryRow, header: HistoryRow | None) -> None:
+        """Insert a new entry at the top, preceded by its day header if given."""
+        if header is None:
+            # Right below the existing header for this day
+            self.beginInsertRows(QModelIndex(), 1, 1)
+            self._rows.insert(1, row)
+        else:
+            self.beginInsertRows(QModelIndex(), 0, 1)
+            self._rows[0:0] = [header, row]
+        self._entry_count += 1
+        self.endInsertRows()
+
+    def remove_entry(self, row: int) -> None:
+        """Remove an entry row, and its day header if that day is now empty."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._entry_count -= 1
+        self.endRemoveRows()
+
+        # A day's entries directly follow its header
+        header_row = row - 1
+        if (
+            header_row >= 0
+            and self._rows[header_row].is_header
+            and (row >= len(self._rows) or self._rows[row].is_header)
+        ):
+            self.beginRemoveRows(QModelIndex(), header_row, header_row)
+            del self._rows[header_row]
+            self.endRemoveRows()
+
+    def toggle_collapsed(self, header_row: int) -> None:
+        """Flip the collapsed state of the day whose header is at header_row."""
+        day_key = self._rows[header_row].day_key
+        if day_key in self.collapsed_days:
+            self.collapsed_days.discard(day_key)
+        else:
+            self.collapsed_days.add(day_key)
+
+        index = self.index(header_row, 0)
+        self.dataChanged.emit(index, index, [Qt.ForegroundRole])
+
+        # Only this day's entries (contiguous after its header) need re-filtering
+        last_row = header_row
+        while last_row + 1 < len(self._rows) and not self._rows[last_row + 1].is_header:
+            last_row += 1
+        if last_row > header_row:
+            self.dataChanged.emit(self.index(header_row + 1, 0), self.index(last_row, 0))
+
+    def entry_count(self) -> int:
+        """Return number of non-header rows (tracked, not recounted)."""
+        return self._entry_count
+
+
+class HistoryProxyModel(QSortFilterProxyModel):
+    """Hides entries of collapsed days; headers always stay visible."""
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        model = self.sourceModel()
+        row = model.row_at(source_row)
+        return row.is_header or row.day_key not in model.collapsed_days
 
 
 class HistoryDelegate(QStyledItemDelegate):
@@ -129,7 +328,7 @@ class HistoryDelegate(QStyledItemDelegate):
         return QSize(option.rect.width(), max(height, min_height))
 
 
-class HistoryWidget(QListWidget):
+class HistoryWidget(QListView):
     """
     Display transcription history with context menu.
 
@@ -140,11 +339,12 @@ class HistoryWidget(QListWidget):
     entrySelected = pyqtSignal(str, str)
     historyCountChanged = pyqtSignal(int)
 
-    # Custom data roles
-    ROLE_DAY_KEY = Qt.UserRole + 1  # Store day key on headers and entries
-    ROLE_IS_HEADER = Qt.UserRole + 2  # True if item is a day header
-    ROLE_TIME = Qt.UserRole + 3  # Store formatted timestamp string
-    ROLE_TIMESTAMP_ISO = Qt.UserRole + 4  # Store ISO timestamp
+    # Custom data roles (defined by the model)
+    ROLE_DAY_KEY = HistoryModel.ROLE_DAY_KEY
+    ROLE_IS_HEADER = HistoryModel.ROLE_IS_HEADER
+    ROLE_TIME = HistoryModel.ROLE_TIME
+    ROLE_TIMESTAMP_ISO = HistoryModel.ROLE_TIMESTAMP_ISO
+    ROLE_ENTRY = HistoryModel.ROLE_ENTRY
 
     def __init__(self, history_manager: HistoryManager | None = None, parent=None) -> None:
         super().__init__(parent)
@@ -155,18 +355,28 @@ class HistoryWidget(QListWidget):
         self._debounce_timer.setSingleShot(True)
         self._debounce_timer.timeout.connect(self._reload_from_file)
 
-        # Track collapsed day groups
-        self._collapsed_days: set[str] = set()
+        # Rows live in the model; the proxy hides entries of collapsed days
+        self._model = HistoryModel(self)
+        self._proxy = HistoryProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self.setModel(self._proxy)
+
+        # Entries added while the list is hidden; inserted on the next show
+        self._pending: list[HistoryEntry] = []
 
         # Set custom delegate for rendering
         self.setItemDelegate(HistoryDelegate(self.ROLE_TIME, self))
 
         # Adjust item sizes to current width without user interaction
-        self.setSizeAdjustPolicy(QListWidget.AdjustToContents)
+        self.setSizeAdjustPolicy(QListView.AdjustToContents)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setResizeMode(QListWidget.Adjust)
+        self.setResizeMode(QListView.Adjust)
         self.setFocusPolicy(Qt.StrongFocus)
 
+        # Lay rows out in batches so the first screenful paints before the rest is measured
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(50)
+
         # Keyboard shortcut for deletion even if focus momentarily leaves the list
         delete_shortcut = QShortcut(QKeySequence.Delete, self)
         delete_shortcut.setContext(Qt.ApplicationShortcut)
@@ -177,10 +387,10 @@ class HistoryWidget(QListWidget):
         self.customContextMenuRequested.connect(self._show_context_menu)
 
         # Double-click to copy (but not on headers)
-        self.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.doubleClicked.connect(self._on_item_double_clicked)
 
         # Single click: header toggles collapse; entry loads into editor
-        self.itemClicked.connect(self._on_item_clicked)
+        self.clicked.connect(self._on_item_clicked)
 
         # Set accessible name
         self.setAccessibleName("Transcription History")
@@ -192,51 +402,49 @@ class HistoryWidget(QListWidget):
         self._emit_count_changed()
 
     def add_entry(self, entry: HistoryEntry) -> None:
-        """Add a single history entry, inserting a day header if needed."""
-        dt = datetime.fromisoformat(entry.timestamp)
-        day_key = dt.date().isoformat()
-
-        # Determine insert position: after the header for this day
-        insert_pos = 0
-        has_header = self._has_header_for_day_at_top(day_key)
-
-        if not has_header:
-            # Create new header at top (no triangle indicator)
-            header_item = QListWidgetItem(self._format_day_header(dt))
-            header_item.setFlags(Qt.ItemIsEnabled)  # non-selectable header
-            header_item.setTextAlignment(Qt.AlignCenter)
-            header_item.setData(self.ROLE_DAY_KEY, day_key)
-            header_item.setData(self.ROLE_IS_HEADER, True)
-            # No tooltip needed; click toggles collapse
-            self._style_header_item(header_item, is_collapsed=False)
-            self.insertItem(0, header_item)
-            insert_pos = 1  # Insert entry right after new header
-        else:
-            insert_pos = 1  # Insert entry right after existing header
+        """Add a single history entry; deferred until shown while the list is hidden."""
+        if not self.isVisible():
+            self._pending.append(entry)
+            self._emit_count_changed()
+            return
 
-        # Create entry item (delegate will handle rendering)
-        timestamp_str = self._format_timestamp(entry)
-        preview_text = entry.text.strip()
-        if len(preview_text) > 100:
-            preview_text = preview_text[:100] + "…"
-        
-        item = QListWidgetItem()
-        item.setData(Qt.DisplayRole, preview_text)
-        item.setData(self.ROLE_TIME, timestamp_str)
-        item.setData(self.ROLE_TIMESTAMP_ISO, entry.timestamp)
-        item.setData(Qt.UserRole, entry.text)
-        item.setData(self.ROLE_DAY_KEY, day_key)
-        item.setData(self.ROLE_IS_HEADER, False)
-        # No tooltip – single-click loads text for editing
-        
-        self.insertItem(insert_pos, item)
+        self._insert_entry(entry)
+        self._refresh_layout()
+        self._emit_count_changed()
 
-        # If this day is collapsed, hide the new entry
-        if day_key in self._collapsed_days:
-            item.setHidden(True)
+    def showEvent(self, event) -> None:
+        """Insert entries that arrived while hidden, with one repaint."""
+        super().showEvent(event)
+        if not self._pending:
+            return
 
+        with self._updates_suspended():
+            for entry in self._pending:
+                self._insert_entry(entry)
+            self._pending.clear()
         self._refresh_layout()
-        self._emit_count_changed()
+
+    @contextmanager
+    def _updates_suspended(self) -> Iterator[None]:
+        """Batch a bulk change into a single viewport repaint."""
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+
+    def _insert_entry(self, entry: HistoryEntry) -> None:
+        """Insert an entry at the top, creating its day header if needed."""
+        dt = datetime.fromisoformat(entry.timestamp)
+        day_key = dt.date().isoformat()
+
+        # New day: create its header at the top (no triangle indicator)
+        header = None
+        if self._model.first_header_day() != day_key:
+            header = HistoryRow(day_key, True, _format_day_header(dt.date()))
+
+        self._model.insert_entry(self._make_entry_row(entry, dt, day_key), header)
 
     def load_history(self, history_manager: HistoryManager | None = None) -> None:
         """Load recent history entries grouped by day with headers."""
@@ -249,152 +457,132 @@ class HistoryWidget(QListWidget):
         if not self.history_manager:
             return
 
-        self.clear()
-        self._collapsed_days.clear()
         entries = self.history_manager.get_recent(limit=100)
+        self._pending.clear()  # Already on disk, so part of this reload
 
         # Get today's date for auto-collapse logic
         today_key = datetime.now().date().isoformat()
 
+        rows: list[HistoryRow] = []
+        collapsed_days: set[str] = set()
         current_day: str | None = None
         for entry in entries:
             dt = datetime.fromisoformat(entry.timestamp)
             day_key = dt.date().isoformat()
             if current_day != day_key:
                 current_day = day_key
-                
+
                 # Auto-collapse all days except today
-                is_today = (day_key == today_key)
-                if not is_today:
-                    self._collapsed_days.add(day_key)
-                
-                header_item = QListWidgetItem(self._format_day_header(dt))
-                header_item.setFlags(Qt.ItemIsEnabled)
-                header_item.setTextAlignment(Qt.AlignCenter)
-                header_item.setData(self.ROLE_DAY_KEY, day_key)
-                header_item.setData(self.ROLE_IS_HEADER, True)
-                # No tooltip for headers
-                self._style_header_item(header_item, is_collapsed=not is_today)
-                self.addItem(header_item)
-
-            # Create entry item (delegate will handle rendering)
-            timestamp_str = self._format_timestamp(entry)
-            preview_text = entry.text.strip()
-            if len(preview_text) > 100:
-                preview_text = preview_text[:100] + "…"
-            
-            item = QListWidgetItem()
-            item.setData(Qt.DisplayRole, preview_text)
-            item.setData(self.ROLE_TIME, timestamp_str)
-            item.setData(self.ROLE_TIMESTAMP_ISO, entry.timestamp)
-            item.setData(Qt.UserRole, entry.text)
-            item.setData(self.ROLE_DAY_KEY, day_key)
-            item.setData(self.ROLE_IS_HEADER, False)
-            # No tooltip – single-click loads text for editing
-            
-            # Hide if day is collapsed
-            if day_key in self._collapsed_days:
-                item.setHidden(True)
-            
-            self.addItem(item)
+                if day_key != today_key:
+                    collapsed_days.add(day_key)
 
-        self._refresh_layout()
+                rows.append(HistoryRow(day_key, True, _format_day_header(dt.date())))
+
+            rows.append(self._make_entry_row(entry, dt, day_key))
+
+        # Whole list swapped in with a single model reset and one repaint
+        with self._updates_suspended():
+            self._model.reset_rows(rows, collapsed_days)
+            self._refresh_layout()
         self._emit_count_changed()
 
-    def _on_item_clicked(self, item: QListWidgetItem) -> None:
+    def clear(self) -> None:
+        """Remove all rows from the view (storage is untouched)."""
+        self._pending.clear()
+        self._model.reset_rows([], set())
+
+    def _make_entry_row(self, entry: HistoryEntry, dt: datetime, day_key: str) -> HistoryRow:
+        """Build the row for an entry from its already-parsed timestamp."""
+        preview_text = entry.text.strip()
+        if len(preview_text) > 100:
+            preview_text = preview_text[:100] + "…"
+        # No tooltip – single-click loads text for editing
+        return HistoryRow(day_key, False, preview_text, self._format_timestamp(dt), entry)
+
+    def _on_item_clicked(self, index: QModelIndex) -> None:
         """Handle single click: header toggles collapse, entry selects for edit."""
-        if item.data(self.ROLE_IS_HEADER):
-            day_key = item.data(self.ROLE_DAY_KEY)
-            self._toggle_day_collapse(day_key, item)
+        if index.data(self.ROLE_IS_HEADER):
+            self._toggle_day_collapse(index)
             return
 
         # Entry: emit text + ISO timestamp for edit pane
-        full_text = item.data(Qt.UserRole)
-        ts_iso = item.data(self.ROLE_TIMESTAMP_ISO) or ""
-        self.entrySelected.emit(full_text, ts_iso)
+        self._emit_entry_selected(index)
 
-    def _on_item_double_clicked(self, item: QListWidgetItem) -> None:
+    def _on_item_double_clicked(self, index: QModelIndex) -> None:
         """Handle double click - copy if it's an entry (not a header)."""
-        if not item.data(self.ROLE_IS_HEADER):
-            self._copy_item(item)
+        if not index.data(self.ROLE_IS_HEADER):
+            self._copy_item(index)
 
-    def _toggle_day_collapse(self, day_key: str, header_item: QListWidgetItem) -> None:
+    def _toggle_day_collapse(self, header_index: QModelIndex) -> None:
         """Toggle visibility of all entries under a day header."""
-        is_collapsed = day_key in self._collapsed_days
-
-        if is_collapsed:
-            # Expand: show all entries for this day
-            self._collapsed_days.discard(day_key)
-            self._style_header_item(header_item, is_collapsed=False)
-        else:
-            # Collapse: hide all entries for this day
-            self._collapsed_days.add(day_key)
-            self._style_header_item(header_item, is_collapsed=True)
-
-        # Update visibility of all items for this day
-        for i in range(self.count()):
-            item = self.item(i)
-            item_day = item.data(self.ROLE_DAY_KEY)
-            is_header = item.data(self.ROLE_IS_HEADER)
-            if item_day == day_key and not is_header:
-                item.setHidden(day_key in self._collapsed_days)
-
-    def _copy_item(self, item: QListWidgetItem) -> None:
+        source_row = self._proxy.mapToSource(header_index).row()
+        if source_row < 0:
+            return  # Header vanished (e.g. reload between press and click)
+        # The proxy re-filters just the day's rows from the model's dataChanged
+        with self._updates_suspended():
+            self._model.toggle_collapsed(source_row)
+
+    def _copy_item(self, index: QModelIndex) -> None:
         """Copy item text to clipboard on double-click."""
-        full_text = item.data(Qt.UserRole)
-        self._copy_to_clipboard(full_text)
+        entry = index.data(self.ROLE_ENTRY)
+        if entry is None:
+            return
+        self._copy_to_clipboard(entry.text)
 
         # Visual feedback
-        original_text = item.text()
-        item.setText(f"✓ Copied: {original_text[:60]}...")
-        QTimer.singleShot(1000, lambda: item.setText(original_text))
+        original_text = index.data(Qt.DisplayRole)
+        target = QPersistentModelIndex(index)
+        self._proxy.setData(index, f"✓ Copied: {original_text[:60]}...", Qt.DisplayRole)
+        QTimer.singleShot(1000, lambda: self._restore_text(target, original_text))
+
+    def _restore_text(self, target: QPersistentModelIndex, text: str) -> None:
+        """Put back a row's text after transient feedback, if the row still exists."""
+        if target.isValid():
+            self._proxy.setData(self._proxy.index(target.row(), 0), text, Qt.DisplayRole)
 
     def _show_context_menu(self, position) -> None:
         """Show context menu on right-click."""
-        item = self.itemAt(position)
-        if not item:
+        index = self.indexAt(position)
+        if not index.isValid() or index.data(self.ROLE_IS_HEADER):
             return
 
-        full_text = item.data(Qt.UserRole)
+        entry = index.data(self.ROLE_ENTRY)
+        target = QPersistentModelIndex(index)
 
         menu = QMenu(self)
 
         copy_action = menu.addAction("Copy to Clipboard")
-        copy_action.triggered.connect(lambda: self._copy_to_clipboard(full_text))
+        copy_action.triggered.connect(lambda: self._copy_to_clipboard(entry.text))
 
         # No reinject action; single-click loads text for editing
         menu.addSeparator()
 
         delete_action = menu.addAction("Delete Entry")
-        delete_action.triggered.connect(lambda: self._delete_item(item))
+        delete_action.triggered.connect(
+            lambda: self._delete_item(self._proxy.index(target.row(), 0))
+        )
 
         menu.exec_(self.mapToGlobal(position))
 
     def _copy_to_clipboard(self, text: str) -> None:
-        """Copy text to clipboard using available method."""
-        if HAS_PYPERCLIP:
-            with suppress(Exception):
-                pyperclip.copy(text)
-                return
-
-        # Fallback to wl-copy (Wayland)
-        with suppress(Exception):
-            subprocess.run(["wl-copy"], input=text, text=True, check=True)
+        """Copy text to clipboard through Qt (in-process, no helper tools)."""
+        if text:
+            QApplication.clipboard().setText(text)
 
     def keyPressEvent(self, event) -> None:
         """Handle keyboard events for item actions."""
-        current_item = self.currentItem()
+        current = self.currentIndex()
 
         match event.key():
             case Qt.Key_Return | Qt.Key_Enter:
                 # Enter on history item → copy
-                if current_item:
-                    self._copy_item(current_item)
+                if current.isValid():
+                    self._copy_item(current)
 
             case Qt.Key_Delete:
                 # Delete key → remove item (with persistence)
-                if current_item:
-                    self._delete_item(current_item)
+                if current.isValid():
+                    self._delete_item(current)
                     event.accept()
                     return
 
@@ -403,69 +591,46 @@ class HistoryWidget(QListWidget):
 
     def _delete_current(self) -> None:
         """Delete the currently selected item (shortcut helper)."""
-        item = self.currentItem()
-        if item and not item.data(self.ROLE_IS_HEADER):
-            self._delete_item(item)
+        current = self.currentIndex()
+        if current.isValid() and not current.data(self.ROLE_IS_HEADER):
+            self._delete_item(current)
 
-    def _delete_item(self, item: QListWidgetItem) -> None:
+    def _delete_item(self, index: QModelIndex) -> None:
         """Remove an entry from the list and persistent storage."""
-        if item.data(self.ROLE_IS_HEADER):
+        if not index.isValid() or index.data(self.ROLE_IS_HEADER):
             return
 
-        ts_iso = item.data(self.ROLE_TIMESTAMP_ISO)
-        day_key = item.data(self.ROLE_DAY_KEY)
-        current_row = self.row(item)
+        ts_iso = index.data(self.ROLE_TIMESTAMP_ISO)
+        current_row = index.row()
 
-        # Remove from UI
-        self.takeItem(self.row(item))
+        # Remove from UI (the model drops the day header if it is now empty)
+        self._model.remove_entry(self._proxy.mapToSource(index).row())
 
         # Persist deletion
         if self.history_manager and ts_iso:
             self.history_manager.delete_entry(ts_iso)
 
-        # Remove header if no more entries under that day
-        self._remove_header_if_empty(day_key)
-
         # Select a sensible fallback item (previous entry preferred)
         self._select_fallback_after_delete(current_row)
         self._emit_count_changed()
 
-    def _remove_header_if_empty(self, day_key: str | None) -> None:
-        """Delete the day header if it has no remaining entries."""
-        if not day_key:
-            return
-
-        # Check for any remaining entries in the same day
-        has_entries = False
-        header_row = None
-        for i in range(self.count()):
-            item = self.item(i)
-            if item.data(self.ROLE_DAY_KEY) != day_key:
-                continue
-            if item.data(self.ROLE_IS_HEADER):
-                header_row = i
-            else:
-                has_entries = True
-                break
-
-        if not has_entries and header_row is not None:
-            self.takeItem(header_row)
-
     def _select_fallback_after_delete(self, deleted_row: int) -> None:
         """After deletion, select the nearest entry and emit selection, or clear."""
+        proxy = self._proxy
+
         # Prefer previous items above the deleted row
-        for i in range(deleted_row - 1, -1, -1):
-            candidate = self.item(i)
-            if candidate and not candidate.data(self.ROLE_IS_HEADER):
-                self.setCurrentItem(candidate)
+        for i in range(min(deleted_row, proxy.rowCount()) - 1, -1, -1):
+            candidate = proxy.index(i, 0)
+            if not candidate.data(self.ROLE_IS_HEADER):
+                self.setCurrentIndex(candidate)
                 self._emit_entry_selected(candidate)
                 return
 
         # Fall back to the next items below
-        for i in range(deleted_row, self.count()):
-            candidate = self.item(i)
-            if candidate and not candidate.data(self.ROLE_IS_HEADER):
-                self.setCurrentItem(candidate)
+        for i in range(deleted_row, proxy.rowCount()):
+            candidate = proxy.index(i, 0)
+            if not candidate.data(self.ROLE_IS_HEADER):
+                self.setCurrentIndex(candidate)
                 self._emit_entry_selected(candidate)
                 return
 
@@ -473,22 +638,18 @@ class HistoryWidget(QListWidget):
         self.entrySelected.emit("", "")
 
     def entry_count(self) -> int:
-        """Return number of non-header history entries."""
-        count = 0
-        for i in range(self.count()):
-            item = self.item(i)
-            if item and not item.data(self.ROLE_IS_HEADER):
-                count += 1
-        return count
+        """Return number of non-header history entries, including deferred ones."""
+        return self._model.entry_count() + len(self._pending)
 
     def _emit_count_changed(self) -> None:
         self.historyCountChanged.emit(self.entry_count())
 
-    def _emit_entry_selected(self, item: QListWidgetItem) -> None:
-        """Emit entrySelected for the given item."""
-        full_text = item.data(Qt.UserRole)
-        ts_iso = item.data(self.ROLE_TIMESTAMP_ISO) or ""
-        self.entrySelected.emit(full_text, ts_iso)
+    def _emit_entry_selected(self, index: QModelIndex) -> None:
+        """Emit entrySelected for the given row."""
+        # Fetch the entry object rather than marshalling its text through a QVariant
+        entry = index.data(self.ROLE_ENTRY)
+        if entry is not None:
+            self.entrySelected.emit(entry.text, entry.timestamp)
 
     def _refresh_layout(self) -> None:
         """Force item relayout to respect current viewport width."""
@@ -536,81 +697,8 @@ class HistoryWidget(QListWidget):
 
     # ---------- Helpers ----------
 
-    def _style_header_item(self, item: QListWidgetItem, is_collapsed: bool) -> None:
-        """Apply distinctive styling to day header items."""
-        # Bold font for headers
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(12)
-        item.setFont(font)
-        
-        # Gray when collapsed, white when expanded
-        if is_collapsed:
-            item.setForeground(QBrush(QColor("#888888")))
-        else:
-            item.setForeground(QBrush(QColor("#ffffff")))
-        
-        # Darker background to distinguish from entries
-        item.setBackground(QBrush(QColor("#1a1a1a")))
-
-    def _has_header_for_day_at_top(self, day_key: str) -> bool:
-        """Check if the first item is a header for the given day."""
-        if self.count() == 0:
-            return False
-        first_item = self.item(0)
-        # Use the ROLE_IS_HEADER flag we set
-        if not first_item.data(self.ROLE_IS_HEADER):
-            return False
-        # Compare day key directly
-        return first_item.data(self.ROLE_DAY_KEY) == day_key
-
-    def _format_day_header(self, dt: datetime) -> str:
-        """Return a friendly day header like 'December 13th'."""
-        month = dt.strftime("%B")
-        day = dt.day
-        suffix = self._ordinal_suffix(day)
-        return f"{month} {day}{suffix}"
-
-    def _format_timestamp(self, entry: HistoryEntry) -> str:
-        """Extract and format just the timestamp portion."""
-        dt = datetime.fromisoformat(entry.timestamp)
-        time_str = dt.strftime("%I:%M %p")
-        time_str = time_str.replace("AM", "a.m.").replace("PM", "p.m.")
-        if time_str.startswith("0"):
-            time_str = time_str[1:]
-        return time_str
-
-    def _format_entry_text(self, entry: HistoryEntry, max_length: int = 80) -> str:
-        """Format a single entry line with blue timestamp using HTML."""
-        dt = datetime.fromisoformat(entry.timestamp)
-        time_str = dt.strftime("%I:%M %p")  # e.g., 10:03 PM
-        # Lowercase: p.m. / a.m.
-        time_str = time_str.replace("AM", "a.m.").replace("PM", "p.m.")
-        # Remove leading zero in hour
-        if time_str.startswith("0"):
-            time_str = time_str[1:]
-
-        text = entry.text.strip()
-        if len(text) > max_length:
-            text = text[:max_length] + "…"
-
-        # Return HTML with styled timestamp
-        return (
-            f"<span style='color:#5a9fd4; font-weight:600;'>{time_str}</span>"
-            f"&nbsp;&nbsp;"
-            f"<span style='color:#d4d4d4;'>{text}</span>"
-        )
-
-    def _ordinal_suffix(self, n: int) -> str:
-        """Return English ordinal suffix for a day (st/nd/rd/th)."""
-        if 11 <= (n % 100) <= 13:
-            return "th"
-        match n % 10:
-            case 1:
-                return "st"
-            case 2:
-                return "nd"
-            case 3:
-                return "rd"
-            case _:
-                return "th"
+    def _format_timestamp(self, dt: datetime) -> str:
+        """Format the time of day like '10:03 p.m.'."""
+        # Arithmetic instead of strftime + replace: one string per call, locale-independent
+        suffix = "a.m." if dt.hour < 12 else "p.m."
+        return f"{dt.hour % 12 or 12}:{dt.minute:02d} {suffix}"
@@ -12,9 +12,14 @@ from PyQt5.QtWidgets import (
 from key_listener import InputEvent, KeyCode, KeyListener
 from ui.keycode_mapping import (
     keycodes_to_strings,
+    normalize_from_string,
     normalize_hotkey_string,
+    parse_hotkey_string,
 )
 
+# System shortcuts that may not be bound as the activation hotkey
+_DANGEROUS_HOTKEYS = frozenset({"alt+f4", "ctrl+alt+delete", "ctrl+c", "ctrl+v", "ctrl+z"})
+
 
 class HotkeyWidget(QWidget):
     """Capture and edit the activation hotkey."""
@@ -51,7 +56,7 @@ class HotkeyWidget(QWidget):
         self.setLayout(layout)
 
     def set_hotkey(self, hotkey: str) -> None:
-        display, _ = keycodes_to_strings(self._parse_hotkey_string(hotkey))
+        display, _ = keycodes_to_strings(parse_hotkey_string(hotkey))
         self.display.setText(display)
         self.validation_label.setVisible(False)
 
@@ -99,39 +104,16 @@ class HotkeyWidget(QWidget):
         if not parts:
             return False, "No keys captured"
         # Block dangerous system shortcuts
-        dangerous = {"alt+f4", "ctrl+alt+delete", "ctrl+c", "ctrl+v", "ctrl+z"}
-        if hotkey.lower() in dangerous:
+        if hotkey.lower() in _DANGEROUS_HOTKEYS:
             return False, "Reserved system shortcut"
         return True, ""
 
-    def _parse_hotkey_string(self, hotkey: str) -> set[KeyCode]:
-        """Best-effort parse of a config hotkey string into KeyCodes for display."""
-        lookup: dict[str, KeyCode] = {code.name.lower(): code for code in KeyCode}
-        result: set[KeyCode] = set()
-        for part in hotkey.lower().split('+'):
-            part = part.strip()
-            match part:
-                case "ctrl":
-                    result.add(KeyCode.CTRL_LEFT)
-                case "shift":
-                    result.add(KeyCode.SHIFT_LEFT)
-                case "alt":
-                    result.add(KeyCode.ALT_LEFT)
-                case "meta":
-                    result.add(KeyCode.META_LEFT)
-                case _:
-                    code = lookup.get(part)
-                    if code:
-                        result.add(code)
-        return result
-
     def get_hotkey(self) -> str:
         """Return the currently displayed hotkey string (config-normalized)."""
-        keys = self.pressed_keys or self._parse_hotkey_string(
-            self.display.text().replace(' + ', '+')
-        )
-        _, config = keycodes_to_strings(keys)
-        return normalize_hotkey_string(config)
+        if not self.pressed_keys:
+            return normalize_from_string(self.display.text().replace(' + ', '+'))
+        _, config = keycodes_to_strings(self.pressed_keys)
+        return config
 
     def cleanup(self) -> None:
         """Clean up capture mode if still active."""
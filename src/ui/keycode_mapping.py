@@ -1,6 +1,9 @@
 """
 Utilities for translating KeyCode enums to display/config strings and ordering.
 """
+from collections.abc import Iterable
+from functools import cache, lru_cache
+
 from key_listener import KeyCode
 
 MODIFIER_ORDER = {
@@ -11,48 +14,65 @@ MODIFIER_ORDER = {
 }
 
 
+_MODIFIERS = frozenset({
+    KeyCode.CTRL_LEFT,
+    KeyCode.CTRL_RIGHT,
+    KeyCode.SHIFT_LEFT,
+    KeyCode.SHIFT_RIGHT,
+    KeyCode.ALT_LEFT,
+    KeyCode.ALT_RIGHT,
+    KeyCode.META_LEFT,
+    KeyCode.META_RIGHT,
+})
+
+
 def is_modifier(code: KeyCode) -> bool:
-    return code in {
-        KeyCode.CTRL_LEFT,
-        KeyCode.CTRL_RIGHT,
-        KeyCode.SHIFT_LEFT,
-        KeyCode.SHIFT_RIGHT,
-        KeyCode.ALT_LEFT,
-        KeyCode.ALT_RIGHT,
-        KeyCode.META_LEFT,
-        KeyCode.META_RIGHT,
-    }
+    return code in _MODIFIERS
+
+
+# Modifiers collapse left/right variants to one name; other keys use the defaults below
+_DISPLAY_NAMES: dict[KeyCode, str] = {
+    KeyCode.CTRL_LEFT: "Ctrl",
+    KeyCode.CTRL_RIGHT: "Ctrl",
+    KeyCode.SHIFT_LEFT: "Shift",
+    KeyCode.SHIFT_RIGHT: "Shift",
+    KeyCode.ALT_LEFT: "Alt",
+    KeyCode.ALT_RIGHT: "Alt",
+    KeyCode.META_LEFT: "Meta",
+    KeyCode.META_RIGHT: "Meta",
+}
+
+_CONFIG_NAMES: dict[KeyCode, str] = {
+    KeyCode.CTRL_LEFT: 'ctrl',
+    KeyCode.CTRL_RIGHT: 'ctrl',
+    KeyCode.SHIFT_LEFT: 'shift',
+    KeyCode.SHIFT_RIGHT: 'shift',
+    KeyCode.ALT_LEFT: 'alt',
+    KeyCode.ALT_RIGHT: 'alt',
+    KeyCode.META_LEFT: 'meta',
+    KeyCode.META_RIGHT: 'meta',
+}
+
+
+@cache
+def _display_default(code: KeyCode) -> str:
+    return code.name.replace('_', ' ').title()
+
+
+@cache
+def _config_default(code: KeyCode) -> str:
+    return code.name.lower()
 
 
 def keycode_to_display_name(code: KeyCode) -> str:
-    match code:
-        case KeyCode.CTRL_LEFT | KeyCode.CTRL_RIGHT:
-            return "Ctrl"
-        case KeyCode.SHIFT_LEFT | KeyCode.SHIFT_RIGHT:
-            return "Shift"
-        case KeyCode.ALT_LEFT | KeyCode.ALT_RIGHT:
-            return "Alt"
-        case KeyCode.META_LEFT | KeyCode.META_RIGHT:
-            return "Meta"
-        case _:
-            name = code.name.replace('_', ' ')
-            return name.title()
+    return _DISPLAY_NAMES.get(code) or _display_default(code)
 
 
 def keycode_to_config_name(code: KeyCode) -> str:
-    match code:
-        case KeyCode.CTRL_LEFT | KeyCode.CTRL_RIGHT:
-            return 'ctrl'
-        case KeyCode.SHIFT_LEFT | KeyCode.SHIFT_RIGHT:
-            return 'shift'
-        case KeyCode.ALT_LEFT | KeyCode.ALT_RIGHT:
-            return 'alt'
-        case KeyCode.META_LEFT | KeyCode.META_RIGHT:
-            return 'meta'
-        case _:
-            return code.name.lower()
+    return _CONFIG_NAMES.get(code) or _config_default(code)
 
 
+@lru_cache(maxsize=512)
 def normalize_hotkey_string(hotkey: str) -> str:
     """Normalize hotkey string: modifiers first (Ctrl, Shift, Alt, Meta), then keys."""
     parts = [p.strip().lower() for p in hotkey.split('+') if p.strip()]
@@ -63,11 +83,50 @@ def normalize_hotkey_string(hotkey: str) -> str:
     return '+'.join(modifiers + main_keys)
 
 
-def keycodes_to_strings(codes: set[KeyCode]) -> tuple[str, str]:
+def keycodes_to_strings(codes: Iterable[KeyCode]) -> tuple[str, str]:
     """Return (display, config) strings from a set of KeyCodes."""
+    # frozenset() of a frozenset is a no-op, so cached callers pay nothing extra
+    return _keycodes_to_strings(frozenset(codes))
+
+
+@lru_cache(maxsize=256)
+def _keycodes_to_strings(codes: frozenset[KeyCode]) -> tuple[str, str]:
+    """Memoized body of keycodes_to_strings, keyed on a hashable key set."""
     sorted_codes = sorted(codes, key=lambda x: x.value)
     config_names = [keycode_to_config_name(c) for c in sorted_codes]
     display_names = [keycode_to_display_name(c) for c in sorted_codes]
     config = normalize_hotkey_string('+'.join(config_names))
     display = ' + '.join(display_names)
     return display, config
+
+
+# Lowercase enum name → KeyCode, built once for hotkey string parsing
+_NAME_TO_KEYCODE: dict[str, KeyCode] = {code.name.lower(): code for code in KeyCode}
+
+
+@lru_cache(maxsize=64)
+def parse_hotkey_string(hotkey: str) -> frozenset[KeyCode]:
+    """Best-effort parse of a config hotkey string into KeyCodes for display."""
+    result: set[KeyCode] = set()
+    for part in hotkey.lower().split('+'):
+        part = part.strip()
+        match part:
+            case "ctrl":
+                result.add(KeyCode.CTRL_LEFT)
+            case "shift":
+                result.add(KeyCode.SHIFT_LEFT)
+            case "alt":
+                result.add(KeyCode.ALT_LEFT)
+            case "meta":
+                result.add(KeyCode.META_LEFT)
+            case _:
+                code = _NAME_TO_KEYCODE.get(part)
+                if code:
+                    result.add(code)
+    return frozenset(result)
+
+
+@lru_cache(maxsize=128)
+def normalize_from_string(hotkey: str) -> str:
+    """Return the normalized config string for a hotkey string (parse → format)."""
+    return keycodes_to_strings(parse_hotkey_string(hotkey))[1]
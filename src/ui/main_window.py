@@ -17,6 +17,7 @@ from PyQt5.QtCore import (
     QTimer,
     QUrl,
     pyqtSignal,
+    pyqtSlot,
 )
 from PyQt5.QtGui import QDesktopServices, QFont, QGuiApplication, QKeySequence
 from PyQt5.QtWidgets import (
@@ -613,7 +614,7 @@ class MainWindow(QMainWindow):
             }
             
             /* History list */
-            QListWidget {
+            QListView {
                 background-color: #252526;
                 border: 1px solid #3c3c3c;
                 border-radius: 4px;
@@ -623,11 +624,11 @@ class MainWindow(QMainWindow):
             }
 
             /* Hide horizontal scrollbar in history */
-            QListWidget QScrollBar:horizontal {
+            QListView QScrollBar:horizontal {
                 height: 0px;
             }
             
-            QListWidget::item {
+            QListView::item {
                 padding: 12px;
                 margin: 4px;
                 border: 1px solid #3c3c3c;
@@ -636,12 +637,12 @@ class MainWindow(QMainWindow):
                 outline: none;
             }
             
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #2d5a7b;
                 border: 1px solid #5a9fd4;
             }
             
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #2d3d4d;
                 border: 1px solid #5a9fd4;
             }
@@ -829,6 +830,7 @@ class MainWindow(QMainWindow):
         """Allow the window to notify the user via tray messages."""
         self._tray_icon = tray_icon
 
+    @pyqtSlot(str)
     def update_transcription_status(self, status: str) -> None:
         """Update recording indicator based on transcription status."""
         match status:
@@ -81,7 +81,10 @@ class OutputOptionsWidget(QWidget):
         self.auto_submit.setChecked(bool(submit_val))
 
     def _setup_cascade(self) -> None:
-        """Connect checkbox state changes to enable/disable dependents."""
+        """Connect checkbox state changes to enable/disable dependents.
+
+        Each handler emits optionsChanged itself, so one slot runs per click.
+        """
         # Level 1: clipboard controls inject
         self.copy_clipboard.stateChanged.connect(self._on_clipboard_changed)
 
@@ -95,11 +98,6 @@ class OutputOptionsWidget(QWidget):
         self._on_clipboard_changed(self.copy_clipboard.checkState())
         self._on_inject_changed(self.auto_inject.checkState())
 
-        # Emit signal for external listeners
-        self.copy_clipboard.stateChanged.connect(lambda: self.optionsChanged.emit())
-        self.auto_inject.stateChanged.connect(lambda: self.optionsChanged.emit())
-        self.auto_submit.stateChanged.connect(lambda: self.optionsChanged.emit())
-
     def _build_layout(self) -> None:
         """Build compact single-row layout."""
         layout = QHBoxLayout()
@@ -143,6 +141,8 @@ class OutputOptionsWidget(QWidget):
             # Uncheck children when parent is unchecked
             self.auto_inject.setChecked(False)
 
+        self.optionsChanged.emit()
+
     def _on_inject_changed(self, state: int) -> None:
         """Enable/disable submit checkbox based on inject state."""
         is_checked = state == Qt.Checked
@@ -154,6 +154,8 @@ class OutputOptionsWidget(QWidget):
         if not is_checked:
             self.auto_submit.setChecked(False)
 
+        self.optionsChanged.emit()
+
     def _on_submit_changed(self, state: int) -> None:
         """Handle auto-submit checkbox change with confirmation."""
         is_checked = state == Qt.Checked
@@ -182,13 +184,15 @@ class OutputOptionsWidget(QWidget):
                 )
 
                 if reply == QMessageBox.No:
-                    # User declined, uncheck the box
+                    # User declined; unchecking re-enters this slot and emits there
                     self.auto_submit.setChecked(False)
                     return
 
                 # Remember that user was warned
                 ConfigManager.set_config_value(True, '_internal', 'auto_submit_warned')
 
+        self.optionsChanged.emit()
+
     def get_options(self) -> dict[str, bool]:
         """Get current checkbox states as dict."""
         return {
@@ -25,6 +25,25 @@ def config_manager(init_config):
     return init_config
 
 
+@pytest.fixture(scope="session")
+def local_model(init_config):
+    """Load the Whisper model once, warmed up, and share it across slow tests."""
+    import numpy as np
+
+    from transcription import create_local_model
+
+    model = create_local_model()
+
+    # One short inference up front so backend warm-up isn't charged to the first test
+    language = init_config.get_config_value('model_options', 'language') or None
+    segments, _ = model.transcribe(
+        audio=np.zeros(8000, dtype=np.float32), language=language, vad_filter=False
+    )
+    for _ in segments:  # Lazy generator: drain it to actually run the model
+        pass
+    return model
+
+
 @pytest.fixture
 def key_listener():
     """Create and yield a KeyListener, stopping it after test."""
@@ -33,3 +52,20 @@ def key_listener():
     yield kl
     with suppress(Exception):
         kl.stop()
+
+
+@pytest.fixture
+def history_manager(config_manager, tmp_path):
+    """Create a HistoryManager backed by a throwaway history file."""
+    from history_manager import HistoryManager
+    return HistoryManager(tmp_path / 'history.jsonl')
+
+
+@pytest.fixture
+def input_simulator(config_manager):
+    """Create and yield an InputSimulator, cleaning it up after test."""
+    from input_simulation import InputSimulator
+    sim = InputSimulator()
+    yield sim
+    with suppress(Exception):
+        sim.cleanup()
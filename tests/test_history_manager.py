@@ -0,0 +1,133 @@
+"""
+Tests for transcription history storage.
+"""
+from history_manager import HistoryEntry
+
+
+class TestRecentCache:
+    """get_recent must reflect every change to the history file."""
+
+    def test_reflects_add(self, history_manager):
+        """Entries added after a read should show up, newest first."""
+        history_manager.add_entry("first")
+        assert [e.text for e in history_manager.get_recent()] == ["first"]
+
+        history_manager.add_entry("second")
+        assert [e.text for e in history_manager.get_recent()] == ["second", "first"]
+
+    def test_reflects_update(self, history_manager):
+        """Edited text should replace the cached entry."""
+        entry = history_manager.add_entry("before")
+        history_manager.get_recent()
+
+        assert history_manager.update_entry(entry.timestamp, "after")
+        assert [e.text for e in history_manager.get_recent()] == ["after"]
+
+    def test_reflects_delete(self, history_manager):
+        """Deleted entries should disappear from the cached list."""
+        keep = history_manager.add_entry("keep")
+        drop = history_manager.add_entry("drop")
+        history_manager.get_recent()
+
+        assert history_manager.delete_entry(drop.timestamp)
+        assert [e.timestamp for e in history_manager.get_recent()] == [keep.timestamp]
+
+    def test_reflects_clear(self, history_manager):
+        """Clearing should empty the cached list."""
+        history_manager.add_entry("gone")
+        history_manager.get_recent()
+
+        history_manager.clear()
+        assert history_manager.get_recent() == []
+
+    def test_reflects_rotation(self, history_manager):
+        """Rotation should drop the oldest entries from the cached list."""
+        for i in range(5):
+            history_manager.add_entry(f"entry {i}")
+        history_manager.get_recent()
+
+        history_manager._rotate_if_needed(3)
+        assert [e.text for e in history_manager.get_recent()] == [
+            "entry 4", "entry 3", "entry 2"
+        ]
+
+    def test_reflects_outside_append(self, history_manager):
+        """A line appended by another process should be picked up."""
+        history_manager.add_entry("ours")
+        history_manager.get_recent()
+
+        outside = HistoryEntry(timestamp="2030-01-01T00:00:00", text="theirs", duration_ms=0)
+        with open(history_manager.history_file, 'a', encoding='utf-8') as f:
+            f.write(outside.to_json() + '\n')
+
+        assert [e.text for e in history_manager.get_recent()] == ["theirs", "ours"]
+
+    def test_limit_is_part_of_cache_key(self, history_manager):
+        """Different limits should not share a cached result."""
+        for i in range(3):
+            history_manager.add_entry(f"entry {i}")
+
+        assert len(history_manager.get_recent(limit=1)) == 1
+        assert len(history_manager.get_recent(limit=3)) == 3
+
+    def test_returned_list_is_a_copy(self, history_manager):
+        """Mutating a returned list should not corrupt the cache."""
+        history_manager.add_entry("only")
+        history_manager.get_recent().clear()
+
+        assert [e.text for e in history_manager.get_recent()] == ["only"]
+
+
+class TestLineCount:
+    """The cached line count drives rotation and must match the file."""
+
+    @staticmethod
+    def _file_lines(history_manager) -> int:
+        with open(history_manager.history_file, 'rb') as f:
+            return sum(1 for _ in f)
+
+    def test_count_follows_appends(self, history_manager):
+        """Appends should extend the cached count."""
+        history_manager.add_entry("one")
+        assert history_manager._count_lines() == 1
+
+        history_manager.add_entry("two")
+        assert history_manager._count_lines() == self._file_lines(history_manager) == 2
+
+    def test_count_survives_rotation(self, history_manager):
+        """After rotation the count should match the trimmed file, then keep growing."""
+        for i in range(5):
+            history_manager.add_entry(f"entry {i}")
+        assert history_manager._count_lines() == 5
+
+        history_manager._rotate_if_needed(3)
+        assert history_manager._count_lines() == self._file_lines(history_manager) == 3
+
+        history_manager.add_entry("after rotation")
+        assert history_manager._count_lines() == self._file_lines(history_manager) == 4
+
+    def test_count_sees_outside_append(self, history_manager):
+        """A line appended by another process should be counted."""
+        history_manager.add_entry("ours")
+        assert history_manager._count_lines() == 1
+
+        outside = HistoryEntry(timestamp="2030-01-01T00:00:00", text="theirs", duration_ms=0)
+        with open(history_manager.history_file, 'a', encoding='utf-8') as f:
+            f.write(outside.to_json() + '\n')
+
+        assert history_manager._count_lines() == 2
+
+    def test_rotation_uses_outside_appends(self, history_manager):
+        """Lines appended outside the manager should count toward the rotation limit."""
+        history_manager.add_entry("ours")
+        history_manager._count_lines()
+
+        with open(history_manager.history_file, 'a', encoding='utf-8') as f:
+            for i in range(3):
+                entry = HistoryEntry(
+                    timestamp=f"2030-01-0{i + 1}T00:00:00", text=f"theirs {i}", duration_ms=0
+                )
+                f.write(entry.to_json() + '\n')
+
+        history_manager._rotate_if_needed(2)
+        assert [e.text for e in history_manager.get_recent()] == ["theirs 2", "theirs 1"]
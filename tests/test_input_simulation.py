@@ -6,29 +6,18 @@ Tests for input simulation (text injection).
 class TestInputSimulator:
     """Tests for InputSimulator class."""
 
-    def test_input_simulator_initializes(self, config_manager):
+    def test_input_simulator_initializes(self, input_simulator):
         """InputSimulator should initialize without error."""
-        from input_simulation import InputSimulator
+        assert input_simulator is not None
+        assert input_simulator.input_method in ['pynput', 'ydotool', 'dotool']
 
-        sim = InputSimulator()
-        assert sim is not None
-        assert sim.input_method in ['pynput', 'ydotool', 'dotool']
-        sim.cleanup()
-
-    def test_typewrite_empty_string(self, config_manager):
+    def test_typewrite_empty_string(self, input_simulator):
         """Typing empty string should not crash."""
-        from input_simulation import InputSimulator
-
-        sim = InputSimulator()
         # Should not raise
-        sim.typewrite("")
-        sim.typewrite(None)  # Should handle None gracefully
-        sim.cleanup()
+        input_simulator.typewrite("")
+        input_simulator.typewrite(None)  # Should handle None gracefully
 
-    def test_cleanup_can_be_called_multiple_times(self, config_manager):
+    def test_cleanup_can_be_called_multiple_times(self, input_simulator):
         """Cleanup should be safe to call multiple times."""
-        from input_simulation import InputSimulator
-
-        sim = InputSimulator()
-        sim.cleanup()
-        sim.cleanup()  # Should not raise
+        input_simulator.cleanup()
+        input_simulator.cleanup()  # Should not raise
@@ -0,0 +1,201 @@
+"""
+Tests for the recorder's capture loop (no audio hardware needed).
+"""
+import numpy as np
+
+FRAME_SIZE = 480  # 30ms at 16kHz
+SAMPLE_RATE = 16000
+
+
+def make_frame(amplitude: int) -> bytes:
+    """Return one frame of int16 samples with a constant magnitude."""
+    return np.full(FRAME_SIZE, amplitude, dtype=np.int16).tobytes()
+
+
+class FakeVad:
+    """Stand-in for webrtcvad.Vad: loud frames are speech; counts calls."""
+
+    def __init__(self, threshold: int = 150) -> None:
+        self.threshold = threshold
+        self.calls = 0
+
+    def is_speech(self, frame_bytes: bytes, sample_rate: int) -> bool:
+        self.calls += 1
+        return int(np.abs(np.frombuffer(frame_bytes, dtype=np.int16)).max()) >= self.threshold
+
+
+def make_state(frames_to_skip: int = 0, capacity: int = SAMPLE_RATE):
+    from result_thread import _CaptureState
+    return _CaptureState(
+        recording=np.empty(capacity, dtype=np.int16), frames_to_skip=frames_to_skip
+    )
+
+
+class TestEnergyGate:
+    """The pre-speech energy gate in front of webrtcvad."""
+
+    def test_calibration_uses_quietest_skipped_frame(self):
+        """The floor should come from the quietest calibration frame times the margin."""
+        from result_thread import ENERGY_FLOOR_MARGIN, _consume_frames
+
+        state = make_state(frames_to_skip=3)
+        batch = [make_frame(50), make_frame(20), make_frame(40)]
+        _consume_frames(batch, state, FakeVad(), 30, SAMPLE_RATE)
+
+        assert state.energy_floor == 20 * FRAME_SIZE * ENERGY_FLOOR_MARGIN
+
+    def test_calibration_floor_is_capped(self):
+        """A noisy start should not raise the floor past the ceiling."""
+        from result_thread import ENERGY_FLOOR_CEILING, _consume_frames
+
+        state = make_state(frames_to_skip=3)
+        _consume_frames([make_frame(5000)] * 3, state, FakeVad(), 30, SAMPLE_RATE)
+
+        assert state.energy_floor == ENERGY_FLOOR_CEILING * FRAME_SIZE
+
+    def test_no_calibration_without_vad(self):
+        """Manual-stop mode has no VAD, so no floor is measured."""
+        from result_thread import _consume_frames
+
+        state = make_state(frames_to_skip=3)
+        _consume_frames([make_frame(50)] * 3, state, None, 30, SAMPLE_RATE)
+
+        assert state.energy_floor is None
+
+    def test_quiet_frames_skip_vad_before_speech(self):
+        """Frames under the floor should not reach webrtcvad before speech."""
+        from result_thread import _consume_frames
+
+        vad = FakeVad()
+        state = make_state(frames_to_skip=3)
+        _consume_frames([make_frame(20)] * 3 + [make_frame(10)] * 5, state, vad, 30, SAMPLE_RATE)
+
+        assert vad.calls == 0
+        assert not state.speech_detected
+
+    def test_quiet_speech_reaches_vad_after_noisy_start(self):
+        """Speech above the ceiling should be detected even after loud calibration frames."""
+        from result_thread import _consume_frames
+
+        vad = FakeVad(threshold=150)
+        state = make_state(frames_to_skip=3)
+        _consume_frames([make_frame(5000)] * 3 + [make_frame(200)], state, vad, 30, SAMPLE_RATE)
+
+        assert vad.calls == 1
+        assert state.speech_detected
+
+    def test_gate_is_off_after_speech(self):
+        """Once speech started, every frame should be checked by webrtcvad."""
+        from result_thread import _consume_frames
+
+        vad = FakeVad()
+        state = make_state(frames_to_skip=3)
+        batch = [make_frame(20)] * 3 + [make_frame(1000)] + [make_frame(10)] * 4
+        _consume_frames(batch, state, vad, 30, SAMPLE_RATE)
+
+        assert vad.calls == 5
+        assert state.silent_frame_count == 4
+
+    def test_gated_silence_stops_after_speech(self):
+        """Trailing silence after speech should end the recording."""
+        from result_thread import _consume_frames
+
+        silence_frames = 3
+        state = make_state(frames_to_skip=3)
+        batch = [make_frame(20)] * 3 + [make_frame(1000)] + [make_frame(10)] * (silence_frames + 1)
+
+        assert _consume_frames(batch, state, FakeVad(), silence_frames, SAMPLE_RATE)
+
+
+class TestConsumeFrames:
+    """Buffering and stop handling of the capture loop."""
+
+    def test_buffer_grows_past_preallocation(self):
+        """Frames beyond the initial capacity should be kept, in order."""
+        from result_thread import _consume_frames
+
+        state = make_state(capacity=100)
+        frames = [make_frame(i) for i in (1, 2, 3)]
+        _consume_frames(frames, state, None, 30, SAMPLE_RATE)
+
+        assert state.recorded == 3 * FRAME_SIZE
+        expected = np.concatenate([np.frombuffer(f, dtype=np.int16) for f in frames])
+        np.testing.assert_array_equal(state.recording[:state.recorded], expected)
+
+    def test_lead_in_frames_are_buffered_but_not_checked(self):
+        """Skipped lead-in frames should be recorded without reaching webrtcvad."""
+        from result_thread import _consume_frames
+
+        vad = FakeVad()
+        state = make_state(frames_to_skip=2)
+        _consume_frames([make_frame(1000)] * 3, state, vad, 30, SAMPLE_RATE)
+
+        assert state.frames_to_skip == 0
+        assert state.recorded == 3 * FRAME_SIZE
+        assert vad.calls == 1
+
+    def test_none_wake_ups_are_ignored(self):
+        """A None stop wake-up should neither be buffered nor end the batch."""
+        from result_thread import _consume_frames
+
+        state = make_state()
+        stopped = _consume_frames([None, make_frame(5), None], state, FakeVad(), 30, SAMPLE_RATE)
+
+        assert not stopped
+        assert state.recorded == FRAME_SIZE
+
+    def test_returns_on_trailing_silence(self):
+        """Enough silence after speech should return True and leave the rest unbuffered."""
+        from result_thread import _consume_frames
+
+        silence_frames = 2
+        state = make_state()
+        batch = [make_frame(1000)] + [make_frame(0)] * (silence_frames + 1) + [make_frame(1000)]
+
+        assert _consume_frames(batch, state, FakeVad(), silence_frames, SAMPLE_RATE)
+        assert state.recorded == (silence_frames + 2) * FRAME_SIZE
+
+    def test_no_stop_without_speech(self):
+        """Silence alone should never end the recording."""
+        from result_thread import _consume_frames
+
+        state = make_state()
+        assert not _consume_frames([make_frame(0)] * 50, state, FakeVad(), 2, SAMPLE_RATE)
+        assert not state.speech_detected
+
+    def test_no_stop_without_vad(self):
+        """Manual-stop mode should buffer everything and never stop on its own."""
+        from result_thread import _consume_frames
+
+        state = make_state()
+        assert not _consume_frames([make_frame(0)] * 50, state, None, 2, SAMPLE_RATE)
+        assert state.recorded == 50 * FRAME_SIZE
+
+
+class TestRecorderStatus:
+    """Status updates crossing from the recorder to the UI."""
+
+    def test_repeated_status_is_emitted_once(self, config_manager):
+        """The same status twice in a row should only be emitted once."""
+        from result_thread import RecorderWorker
+
+        worker = RecorderWorker()
+        seen = []
+        worker.statusSignal.connect(seen.append)
+        worker._set_status('recording')
+        worker._set_status('recording')
+
+        assert seen == ['recording']
+
+    def test_cancel_is_not_overridden_by_late_worker_status(self, config_manager):
+        """A worker update arriving after stop() should not replace 'idle'."""
+        from result_thread import RecorderWorker
+
+        worker = RecorderWorker()
+        seen = []
+        worker.statusSignal.connect(seen.append)
+        worker._set_status('recording')
+        worker.stop()
+        worker._set_status('transcribing')
+
+        assert seen == ['recording', 'idle']
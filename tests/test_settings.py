@@ -60,6 +60,13 @@ class TestKeycodeMapping:
         assert "ctrl" in config
         assert "a" in config
 
+    def test_normalize_from_string(self):
+        from ui.keycode_mapping import normalize_from_string
+
+        assert normalize_from_string("shift+ctrl+a") == "ctrl+shift+a"
+        assert normalize_from_string("Alt+Space") == "alt+space"
+        assert normalize_from_string("ctrl+bogus") == "ctrl"
+
 
 class TestHotkeyWidgetLogic:
     """Tests for HotkeyWidget validation logic (no Qt required)."""
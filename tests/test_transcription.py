@@ -51,16 +51,15 @@ class TestTranscribeFunction:
         assert result == ""
 
     @pytest.mark.slow
-    def test_transcribe_silent_audio(self):
+    def test_transcribe_silent_audio(self, local_model):
         """Transcribing silence should return empty or minimal text."""
-        from transcription import create_local_model, transcribe
+        from transcription import transcribe
 
         # Create 1 second of silence (int16)
         sample_rate = 16000
         silence = np.zeros(sample_rate, dtype=np.int16)
 
-        model = create_local_model()
-        result = transcribe(silence, model)
+        result = transcribe(silence, local_model)
 
         # Silent audio should produce empty or very short result
         assert len(result.strip()) < 10
@@ -70,18 +69,12 @@ class TestModelLoading:
     """Tests for model loading (marked as slow)."""
 
     @pytest.mark.slow
-    def test_model_loads(self):
+    def test_model_loads(self, local_model):
         """Model should load successfully."""
-        from transcription import create_local_model
-
-        model = create_local_model()
-        assert model is not None
+        assert local_model is not None
 
     @pytest.mark.slow
-    def test_model_has_transcribe_method(self):
+    def test_model_has_transcribe_method(self, local_model):
         """Loaded model should have transcribe method."""
-        from transcription import create_local_model
-
-        model = create_local_model()
-        assert hasattr(model, 'transcribe')
-        assert callable(model.transcribe)
+        assert hasattr(local_model, 'transcribe')
+        assert callable(local_model.transcribe)